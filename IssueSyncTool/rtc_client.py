@@ -1,12 +1,11 @@
 import requests
-import copy
 import urllib3
 from io import BytesIO
 from lxml import etree
 import os
-import re
 from xml.sax.saxutils import escape
 from collections import defaultdict, deque
+from IssueSyncTool.utils import RTC_PRIORITY_PATTERN
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
 def get_xml_tree(file_name, bdtd_validation=True):
@@ -163,6 +162,8 @@ Initialize the RTCClient instance.
       if state_transition:
          self.state_transition = state_transition
       self.state_transition_graph = None
+      # Table of action sequences per (current state, new state), filled on first use of each transition
+      self.state_actions = dict()
 
    def __remove_description_nodes(self, oWorkItem, nsmap):
       # Remove all existing links as Description to avoid updating Workitem's Summary
@@ -312,7 +313,7 @@ Get the project scope link.
          else:
             return ""
 
-      if project_scope.lower() not in self.defined_project_scope.keys():
+      if project_scope.lower() not in self.defined_project_scope:
          raise Exception(f"Given Project Scope value '{project_scope}' is not valid, it should be in {[item for item in self.defined_project_scope.keys()]}")
       return self.defined_project_scope[project_scope.lower()]
 
@@ -448,7 +449,7 @@ Get the action identifier for changing workitem status.
       if not workflow_id:
          workflow_id = self.workflow_id
 
-      headers = copy.deepcopy(self.headers)
+      headers = dict(self.headers)
       del headers["OSLC-Core-version"]
       url = f"{self.hostname}/ccm/oslc/workflows/{project_id}/actions/{workflow_id}"
       res = requests.get(url, allow_redirects=True, verify=False, headers=headers)
@@ -528,7 +529,7 @@ Get the priority values for the specified project.
          # 3 - Medium
          # 2 - High
          # 1 - Very High
-         matched_priority = re.match(r"^(\d)(\s*-\s8\w+)?", priority)
+         matched_priority = RTC_PRIORITY_PATTERN.match(priority)
          if matched_priority:
             priority = matched_priority.group(1)
 
@@ -568,7 +569,7 @@ Get the priority link.
          else:
             return ""
 
-      if str(priority) not in self.defined_priority.keys():
+      if str(priority) not in self.defined_priority:
          raise Exception(f"Given priority value '{priority}' is not valid, it should be in {[item for item in self.defined_priority.keys()]}")
       return self.defined_priority[str(priority)]
 
@@ -678,7 +679,7 @@ Get the complexity link for the specified story point.
 
   The complexity link for the specified story point.
       """
-      if str(story_point) not in self.defined_complexity.keys():
+      if str(story_point) not in self.defined_complexity:
          raise Exception(f"Given story point value '{story_point}' is not valid, it should be in {[item for item in self.defined_complexity.keys()]}")
       return self.defined_complexity[str(story_point)]
 
@@ -858,7 +859,7 @@ Get a work item by its ID.
 
   The work item data.
       """
-      headers = copy.deepcopy(self.headers)
+      headers = dict(self.headers)
       req_url = f"{self.hostname}/ccm/oslc/workitems/{ticket_id}"
       response = self.session.get(req_url, headers=headers, verify=False)
       if response.status_code == 200:
@@ -889,7 +890,7 @@ Update a work item with the specified attributes.
 (*no returns*)
       """
       url = f"{self.hostname}/ccm/oslc/workitems/{ticket_id}"
-      headers = copy.deepcopy(self.headers)
+      headers = dict(self.headers)
       headers["Accept"] = "application/xml"
       res = self.session.get(url, headers=headers, verify=False)
       remaining_children = []
@@ -913,7 +914,7 @@ Update a work item with the specified attributes.
                modified_val = list(map(lambda s: s.replace(" ", "_"), val))
                oAttr.text = ", ".join(modified_val)
             elif attr == "type":
-               if val.lower() not in self.defined_workitem_type.keys():
+               if val.lower() not in self.defined_workitem_type:
                   raise Exception(f"Not support RTC workitem type {val}")
                workitem_type_url = self.defined_workitem_type[val.lower()]
                oAttr.set("{%s}resource" % nsmap['rdf'], workitem_type_url)
@@ -1013,8 +1014,15 @@ Update the state of a work item.
 
 * ``None``
       """
-      self.__build_state_transition()
-      action_list = self.__find_action_state_change(current_state, new_state)
+      transition = (current_state, new_state)
+      action_list = self.state_actions.get(transition)
+      if action_list is None:
+         # Graph and actions are only computed from the static transition definition,
+         # concurrent sync jobs compute the same result and setdefault keeps the first one
+         if self.state_transition_graph is None:
+            self.__build_state_transition()
+         action_list = self.state_actions.setdefault(transition,
+                                                     self.__find_action_state_change(current_state, new_state))
 
       if not action_list:
          raise Exception(f"Could not found the proper action to change state from '{current_state}' to '{new_state}'")
@@ -1044,7 +1052,7 @@ Update the state of a work item by performing the specified action.
 
 * ``None``
       """
-      headers = copy.deepcopy(self.headers)
+      headers = dict(self.headers)
       headers["Accept"] = "application/xml"
       workitem_url = f"{self.hostname}/ccm/oslc/workitems/{ticket_id}"
       res = self.session.get(workitem_url, allow_redirects=True, verify=False, headers=headers)
@@ -1052,7 +1060,7 @@ Update the state of a work item by performing the specified action.
          raise Exception(f"Could not found workitem {ticket_id}")
 
       action_identifier = self.__get_action_identifier()
-      if action not in action_identifier.keys():
+      if action not in action_identifier:
          raise Exception(f"Could not found action '{action}'")
 
       action_id = action_identifier[action]
@@ -1157,7 +1165,7 @@ Create a new work item.
 
       # Verify RTC workitem type
       workitem_type_url = ""
-      if type.lower() not in self.defined_workitem_type.keys():
+      if type.lower() not in self.defined_workitem_type:
          raise Exception(f"Not support RTC workitem type {type}")
       else:
          workitem_type_url = self.defined_workitem_type[type.lower()]
@@ -1300,7 +1308,7 @@ Remove given property from work item.
 
       property_name = self.xml_attr_mapping[property].split(':')[1]
       url = f"{self.hostname}/ccm/oslc/workitems/{ticket_id}?oslc_cm.properties={property_name}"
-      headers = copy.deepcopy(self.headers)
+      headers = dict(self.headers)
       headers["Accept"] = "application/xml"
       res = self.session.get(url, headers=headers, verify=False)
       if res.status_code != 200:
@@ -1,9 +1,11 @@
 import colorama as col
+import atexit
 import json
-import copy
+import csv
 import sys
 import os
 import re
+import threading
 from .version import VERSION, VERSION_DATE
 from .utils import (
    CONFIG_SCHEMA,
@@ -14,16 +16,159 @@ from .utils import (
    REGEX_SPRINT_BACKLOG
 )
 from argparse import ArgumentParser
-from jsonschema import validate
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import groupby
+from operator import attrgetter
+from jsonschema.validators import validator_for
+from jsonschema.exceptions import best_match
 from .tracker import Tracker, Status, Ticket
 from .user import UserManagement
 
+# Use the faster orjson parser for configuration file when it is available
+try:
+   from orjson import loads as json_loads
+except ImportError:
+   from json import loads as json_loads
+
+# Precompiled regular expressions
+SPRINT_LABEL_PATTERN = re.compile(REGEX_SPRINT_LABEL)
+SPRINT_BACKLOG_PATTERN = re.compile(REGEX_SPRINT_BACKLOG)
+VERSION_LABEL_PATTERN = re.compile(REGEX_VERSION_LABEL)
+PRIORITY_LABEL_PATTERN = re.compile(REGEX_PRIORITY_LABEL)
+STORY_POINT_LABEL_PATTERN = re.compile(REGEX_STORY_POINT_LABEL)
+DESTINATION_ID_PATTERN = re.compile(r"\[ (\d+) \]")
+ENV_VARIABLE_PATTERN = re.compile(r"\$\{(.*?)\}")
+
+# Fixed prefixes of labels which can match REGEX_SPRINT_LABEL or REGEX_SPRINT_BACKLOG
+SPRINT_LABEL_PREFIXES = ("PI", "Backlog", "backlog")
+
+def inline_schema_refs(schema, defs=None):
+   """
+Replace the local ``$ref`` references to ``#/$defs/...`` by the referenced definitions.
+
+**Arguments:**
+
+*  ``schema``
+
+   / *Condition*: required / *Type*: dict /
+
+   The JSON schema.
+
+*  ``defs``
+
+   / *Condition*: optional / *Type*: dict / *Default*: None /
+
+   The definitions to inline, ``$defs`` of the given schema if not given.
+
+**Returns:**
+
+*  ``schema``
+
+   / *Type*: dict /
+
+   The JSON schema without ``$defs`` and local references.
+   """
+   if defs is None:
+      defs = schema.get("$defs", {})
+   if isinstance(schema, dict):
+      ref = schema.get("$ref", "")
+      inlined = {key: inline_schema_refs(val, defs) for key, val in schema.items() if key not in ("$defs", "$ref")}
+      if ref.startswith("#/$defs/"):
+         # keywords beside "$ref" (e.g. "minItems") apply together with the referenced definition
+         definition = inline_schema_refs(defs[ref[len("#/$defs/"):]], defs)
+         if definition.keys() & inlined.keys():
+            return {"allOf": [definition, inlined]}
+         return {**definition, **inlined}
+      elif ref:
+         inlined["$ref"] = ref
+      return inlined
+   elif isinstance(schema, list):
+      return [inline_schema_refs(item, defs) for item in schema]
+   return schema
+
+# Use the generated validation code of fastjsonschema when it is available,
+# jsonschema is still used to report the best matching error of an invalid configuration
+try:
+   from fastjsonschema import compile as compile_schema, JsonSchemaException
+except ImportError:
+   compile_schema = None
+
+@lru_cache(maxsize=None)
+def get_config_validator():
+   """
+Get the jsonschema validator of the configuration, it is built once on first use
+with the inlined references of ``CONFIG_SCHEMA``.
+
+**Returns:**
+
+*  ``validator``
+
+   / *Type*: jsonschema.protocols.Validator /
+
+   The configuration validator.
+   """
+   schema = inline_schema_refs(CONFIG_SCHEMA)
+   return validator_for(schema)(schema)
+
+@lru_cache(maxsize=None)
+def get_fast_config_validator():
+   """
+Get the validation function generated by fastjsonschema for the configuration, it is built once on first use.
+
+**Returns:**
+
+*  ``validate``
+
+   / *Type*: callable /
+
+   The function which raises ``JsonSchemaException`` for an invalid configuration.
+   """
+   return compile_schema(inline_schema_refs(CONFIG_SCHEMA))
+
+def is_valid_config(config) -> bool:
+   """
+Check whether the given configuration satisfies the configuration schema.
+
+**Arguments:**
+
+*  ``config``
+
+   / *Condition*: required / *Type*: dict /
+
+   The configuration data.
+
+**Returns:**
+
+*  ``is_valid``
+
+   / *Type*: bool /
+
+   True if the configuration is valid.
+   """
+   if compile_schema is None:
+      return get_config_validator().is_valid(config)
+   try:
+      get_fast_config_validator()(config)
+      return True
+   except JsonSchemaException:
+      return False
+
+# Status labels of original issue and their according status, ordered by precedence:
+# (label, label on Jira which does not allow space, status)
+STATUS_LABEL_MAPPING = (
+   ("ready for verifying", "ready_for_verifying", Status.closed),
+   ("in work", "in_work", Status.inProgress)
+)
+
 class Logger:
    """
 Logger class for logging messages.
    """
    output_logfile = None
    output_console = True
+   logfile_handle = None
+   lock = threading.Lock()
    color_normal   = col.Fore.WHITE + col.Style.NORMAL
    color_error    = col.Fore.RED + col.Style.BRIGHT
    color_warn     = col.Fore.YELLOW + col.Style.BRIGHT
@@ -33,6 +178,9 @@ Logger class for logging messages.
    prefix_fatalerror = "FATAL ERROR: "
    prefix_all = ""
    dryrun = False
+   # pre-assembled prefix and indentations to reduce string concatenation per log line
+   console_prefix = prefix_all + color_reset
+   indent_cache = {i: " "*i for i in range(0, 32, 2)}
 
    @classmethod
    def config(cls, output_console=True, output_logfile=None, dryrun=False):
@@ -65,9 +213,20 @@ Configure Logger class.
       """
       cls.output_console = output_console
       cls.output_logfile = output_logfile
+      if cls.logfile_handle:
+         cls.logfile_handle.close()
+         cls.logfile_handle = None
+      if cls.output_logfile:
+         # keep the log file opened with buffered writing instead of opening it per log line
+         cls.logfile_handle = open(cls.output_logfile, 'a', buffering=8192, encoding='utf-8')
+         atexit.register(cls.logfile_handle.close)
       cls.dryrun = dryrun
+      if not sys.stdout.isatty():
+         # ANSI color codes are useless when console output is redirected to file or pipe
+         cls.color_normal = cls.color_error = cls.color_warn = cls.color_reset = ""
       if cls.dryrun:
          cls.prefix_all = cls.color_warn + "DRYRUN  " + cls.color_reset
+      cls.console_prefix = cls.prefix_all + cls.color_reset
 
    @classmethod
    def log(cls, msg='', color=None, indent=0):
@@ -100,11 +259,14 @@ Write log message to console/file output.
       """
       if color is None:
          color = cls.color_normal
-      if cls.output_console:
-         print(cls.prefix_all + cls.color_reset + color + " "*indent + msg + cls.color_reset)
-      if cls.output_logfile and os.path.isfile(cls.output_logfile):
-         with open(cls.output_logfile, 'a') as f:
-            f.write(cls.prefix_all + " "*indent + msg + "\n")
+      indent_str = cls.indent_cache.get(indent)
+      if indent_str is None:
+         indent_str = " "*indent
+      with cls.lock:
+         if cls.output_console:
+            sys.stdout.write("".join((cls.console_prefix, color, indent_str, msg, cls.color_reset, "\n")))
+         if cls.logfile_handle:
+            cls.logfile_handle.write("".join((cls.prefix_all, indent_str, msg, "\n")))
       return
 
    @classmethod
@@ -131,6 +293,8 @@ Write warning message to console/file output.
 (*no returns*)
       """
       cls.log(cls.prefix_warn+str(msg), cls.color_warn, indent)
+      if cls.logfile_handle:
+         cls.logfile_handle.flush()
 
    @classmethod
    def log_error(cls, msg, fatal_error=False, indent=0):
@@ -166,6 +330,8 @@ Write error message to console/file output.
          prefix = cls.prefix_fatalerror
 
       cls.log(prefix+str(msg), cls.color_error, indent)
+      if cls.logfile_handle:
+         cls.logfile_handle.flush()
       if fatal_error:
          cls.log(f"{sys.argv[0]} has been stopped!", cls.color_error)
          raise SystemExit(1)
@@ -197,7 +363,7 @@ def update_issue_relationship(tracker, issue, des_tracker_type):
    return issue
 
 def get_id_from_title(title):
-   oMatch =  re.match(r"\[ (\d+) \]", title)
+   oMatch = DESTINATION_ID_PATTERN.match(title)
    if oMatch:
       return oMatch.group(1)
 
@@ -206,40 +372,40 @@ def get_id_from_title(title):
 def get_additional_labels_of_sprint(sprint, component, sprint_label_mapping=None, component_mapping=None):
    version_label = ""
 
-   if sprint_label_mapping and sprint in sprint_label_mapping.keys():
+   if sprint_label_mapping and sprint in sprint_label_mapping:
       # Check which project (DevAtServ or AIO) to get proper version label
       # Use AIO version label as default
-      if component_mapping and (component in component_mapping) and (component_mapping[component] in sprint_label_mapping[sprint].keys()):
+      if component_mapping and (component in component_mapping) and (component_mapping[component] in sprint_label_mapping[sprint]):
          version_label = sprint_label_mapping[sprint][component_mapping[component]]
-      elif "AIO" in sprint_label_mapping[sprint].keys():
+      elif "AIO" in sprint_label_mapping[sprint]:
          version_label = sprint_label_mapping[sprint]["AIO"]
 
    return version_label
 
-def write_csv_files(filename, list_line):
+def get_tracker_connect_params(tracker_config):
    """
-Write a list of lines to a CSV file.
+Get the parameters to connect to tracker from its configuration.
+
+The returned dictionary is a shallow view of the configuration without the
+non-connection settings ``condition`` and ``is_master``.
 
 **Arguments:**
 
-*  ``filename``
+*  ``tracker_config``
 
-   / *Condition*: required / *Type*: str /
+   / *Condition*: required / *Type*: dict /
 
-   The name of the CSV file.
+   The tracker configuration.
 
-*  ``list_line``
+**Returns:**
 
-   / *Condition*: required / *Type*: list /
+*  ``params``
 
-   A list of lines to write to the CSV file.
+   / *Type*: dict /
 
-**Returns:**
-
-(*no returns*)
+   The parameters for ``connect`` method of tracker.
    """
-   with open(filename, 'w', encoding='utf-8') as fh:
-      fh.writelines(list_line)
+   return {key: val for key, val in tracker_config.items() if key not in ('condition', 'is_master')}
 
 def process_cli_argument():
    """
@@ -268,6 +434,8 @@ Create and configure the ArgumentParser instance, then process command-line argu
                                 'and any previously synced issues with this label will be closed.')
    cli_parser.add_argument('--status-only', action="store_true",
                            help='If set, only update status of synced issue on destination tracker.')
+   cli_parser.add_argument('--jobs', type=int, default=1,
+                           help='number of issues which are synced concurrently (default: 1)')
    cli_parser.add_argument('-v', '--version', action='version',
                            version=f"v{VERSION} ({VERSION_DATE})",
                            help='version of the IssueSyncTool')
@@ -296,31 +464,36 @@ Process the configuration JSON file.
    """
    # Function to resolve environment variables in a string
    def resolve_env_variables(value):
-      if isinstance(value, str):
-         # Match patterns like ${VAR_NAME}
-         matches = re.findall(r"\$\{(.*?)\}", value)
-         for match in matches:
-            env_value = os.getenv(match, "")
-            value = value.replace(f"${{{match}}}", env_value)
-      return value
-
-   # Recursively resolve environment variables in the JSON data
+      # Replace patterns like ${VAR_NAME} in a single pass
+      return ENV_VARIABLE_PATTERN.sub(lambda match: os.getenv(match.group(1), ""), value)
+
+   # Recursively resolve environment variables in the JSON data (in place)
    def resolve(data):
-      if isinstance(data, dict):
-         return {key: resolve(value) for key, value in data.items()}
-      elif isinstance(data, list):
-         return [resolve(item) for item in data]
-      else:
-         return resolve_env_variables(data)
+      items = data.items() if isinstance(data, dict) else enumerate(data)
+      for key, value in items:
+         if isinstance(value, (dict, list)):
+            resolve(value)
+         elif isinstance(value, str) and "${" in value:
+            data[key] = resolve_env_variables(value)
+      return data
 
    if os.path.isfile(path_file):
-      with open(path_file, 'r') as json_file:
+      with open(path_file, 'rb') as json_file:
          try:
-            config = json.load(json_file)
+            # both parsers accept bytes and raise subclass of json.JSONDecodeError
+            config = json_loads(json_file.read())
          except json.JSONDecodeError as e:
             Logger.log_error(f"Error decoding JSON file: {e}", fatal_error=True)
          try:
-            validate(config, CONFIG_SCHEMA)
+            if not is_valid_config(config):
+               error = best_match(get_config_validator().iter_errors(config))
+               if error is not None:
+                  raise error
+               # fastjsonschema (draft 7 semantics) may reject a configuration which jsonschema accepts,
+               # such configuration is never accepted, its own error is reported instead
+               if compile_schema is not None:
+                  get_fast_config_validator()(config)
+               raise Exception("Configuration does not satisfy the configuration schema")
          except Exception as reason:
             Logger.log_error(f"Invalid configuration json file. Reason: {reason}.", fatal_error=True)
 
@@ -361,13 +534,13 @@ Process title of the ticket with component mapping.
    The issue title for destination tracker.
    """
    # avoid unwanted destination tracker id in destination tracker title
-   if re.match(r"\[ \d+ \]", title):
-      title = re.sub(r"\[ \d+ \]", "", title).strip()
+   # the cheap prefix check avoids the regex matching for most of titles
+   if title.startswith("[ ") and DESTINATION_ID_PATTERN.match(title):
+      title = DESTINATION_ID_PATTERN.sub("", title).strip()
 
    # process component mapping to add prefix [ {component_name} ] to title
-   if component_mapping:
-      if component and component in component_mapping:
-         title = f"[ {component_mapping[component]} ] {title}"
+   if component_mapping and component and component in component_mapping:
+      title = f"[ {component_mapping[component]} ] {title}"
 
    return title
 
@@ -520,16 +693,15 @@ and no sync-back of planning data is performed on the original.
       org_issue = org_tracker.get_ticket(org_issue.id, org_issue.component)
 
    org_issue = update_issue_relationship(org_tracker, org_issue, des_tracker.TYPE)
-   dest_issue = des_tracker.get_ticket(org_issue.destination_id)
 
    # mapping the original status with status labels "in work" and "ready for verifying"
+   org_label_set = org_issue.label_set
    if org_issue.status != Status.closed:
-      if ("ready for verifying" in org_issue.labels) or \
-         ("ready_for_verifying" in org_issue.labels and org_tracker.TYPE == "jira"):
-         org_issue.status = Status.closed
-      elif ("in work" in org_issue.labels) or \
-           ("in_work" in org_issue.labels and org_tracker.TYPE == "jira"):
-         org_issue.status = Status.inProgress
+      is_jira = org_tracker.TYPE == "jira"
+      for status_label, jira_status_label, status in STATUS_LABEL_MAPPING:
+         if (status_label in org_label_set) or (is_jira and jira_status_label in org_label_set):
+            org_issue.status = status
+            break
 
    # Update original issue
    org_update_param = dict()
@@ -541,32 +713,33 @@ and no sync-back of planning data is performed on the original.
       Logger.log(f"Updating {org_issue.tracker.title()} issue {org_issue.id}:", indent=4)
 
       # remove existing sprint label include 'backlog'
-      sprint_label_regex = re.compile(REGEX_SPRINT_LABEL)
-      backlog_sprint_regex = re.compile(REGEX_SPRINT_BACKLOG)
-      updated_labels = [i for i in updated_labels if (not sprint_label_regex.match(i) and
-                                                      i != 'backlog' and
-                                                      not backlog_sprint_regex.match(i))]
+      # the cheap prefix check avoids the regex matching for most of labels
+      updated_labels = [i for i in updated_labels if not (i.startswith(SPRINT_LABEL_PREFIXES) and
+                                                          (SPRINT_LABEL_PATTERN.match(i) or
+                                                           SPRINT_BACKLOG_PATTERN.match(i)))]
 
       if des_is_master:
          # Destination is master: sync back planning information from destination to original
-         if dest_issue.sprint and not backlog_sprint_regex.match(dest_issue.sprint):
+         if dest_issue.sprint and not SPRINT_BACKLOG_PATTERN.match(dest_issue.sprint):
             if org_tracker.TYPE == "jira":
                Logger.log(f"Adding ticket {org_issue.id} to sprint '{dest_issue.sprint}'", indent=6)
                org_tracker.add_issues_to_sprint(dest_issue.sprint, [org_issue.id])
 
             Logger.log(f"Adding sprint label '{dest_issue.sprint}'", indent=6)
-            org_tracker.create_label(dest_issue.sprint, repository=org_issue.component)
+            new_labels = [dest_issue.sprint]
             updated_labels = updated_labels+[dest_issue.sprint]
 
             # Get version label which maps to ticket planning sprint
             version_label = get_additional_labels_of_sprint(dest_issue.sprint, org_issue.component, sprint_version_mapping, component_mapping)
             if version_label:
-               version_label_regex = re.compile(REGEX_VERSION_LABEL)
                # Remove existing version label in original ticket
-               updated_labels = [i for i in updated_labels if not version_label_regex.match(i)]
+               updated_labels = [i for i in updated_labels if not VERSION_LABEL_PATTERN.match(i)]
                Logger.log(f"Adding version label '{version_label}'", indent=6)
-               org_tracker.create_label(version_label, repository=org_issue.component)
+               new_labels.append(version_label)
                updated_labels = updated_labels+[version_label]
+
+            # Create the sprint and version labels at once before they are added to the ticket
+            org_tracker.create_labels(new_labels, repository=org_issue.component)
          else:
             Logger.log_warning(f"Adding 'backlog' label for unplanned issue", indent=6)
             updated_labels = updated_labels+['backlog']
@@ -575,9 +748,8 @@ and no sync-back of planning data is performed on the original.
          if dest_issue.priority:
             if org_tracker.TYPE in ["github", "gitlab"]:
                # add priority label for github and gitlab tracker
-               priority_label_regex = re.compile(REGEX_PRIORITY_LABEL)
                # Remove existing priority label in original ticket
-               updated_labels = [i for i in updated_labels if not priority_label_regex.match(i)]
+               updated_labels = [i for i in updated_labels if not PRIORITY_LABEL_PATTERN.match(i)]
                updated_labels = updated_labels+[f'prio {dest_issue.priority}']
             elif org_tracker.TYPE == "jira":
                # add priority field for jira tracker
@@ -595,9 +767,8 @@ and no sync-back of planning data is performed on the original.
          # sync back story point from destination if it is set
          if dest_issue.story_point:
             # add story_point label for github and gitlab tracker
-            story_point_label_regex = re.compile(REGEX_STORY_POINT_LABEL)
             # Remove existing story_point label in original ticket
-            updated_labels = [i for i in updated_labels if not story_point_label_regex.match(i)]
+            updated_labels = [i for i in updated_labels if not STORY_POINT_LABEL_PATTERN.match(i)]
             if org_tracker.TYPE in ["github", "gitlab"]:
                updated_labels = updated_labels+[f'{dest_issue.story_point} pts']
             elif org_tracker.TYPE == "jira":
@@ -608,12 +779,11 @@ and no sync-back of planning data is performed on the original.
       #    # Original is master: keep existing sprint/version labels from original; no sync-back
       #    Logger.log(f"Destination is not master — keeping planning info from original tracker", indent=6)
       #    # Re-apply the original sprint label if present (already stripped above, re-add)
-      #    if org_issue.sprint and not backlog_sprint_regex.match(org_issue.sprint):
+      #    if org_issue.sprint and not SPRINT_BACKLOG_PATTERN.match(org_issue.sprint):
       #       updated_labels = updated_labels+[org_issue.sprint]
       #    # Re-apply the original story_point label if present
       #    if org_issue.story_point:
-      #       story_point_label_regex = re.compile(REGEX_STORY_POINT_LABEL)
-      #       updated_labels = [i for i in updated_labels if not story_point_label_regex.match(i)]
+      #       updated_labels = [i for i in updated_labels if not STORY_POINT_LABEL_PATTERN.match(i)]
       #       if org_tracker.TYPE in ["github", "gitlab"]:
       #          updated_labels = updated_labels+[f'{org_issue.story_point} pts']
       #       elif org_tracker.TYPE == "jira":
@@ -621,8 +791,7 @@ and no sync-back of planning data is performed on the original.
       #    # Re-apply the original priority label if present
       #    if org_issue.priority:
       #       if org_tracker.TYPE in ["github", "gitlab"]:
-      #          priority_label_regex = re.compile(REGEX_PRIORITY_LABEL)
-      #          updated_labels = [i for i in updated_labels if not priority_label_regex.match(i)]
+      #          updated_labels = [i for i in updated_labels if not PRIORITY_LABEL_PATTERN.match(i)]
       #          updated_labels = updated_labels+[f'prio {org_issue.priority}']
 
       org_update_param['labels'] = updated_labels
@@ -644,6 +813,7 @@ and no sync-back of planning data is performed on the original.
          assignee_id = assignee.id[des_tracker.TYPE]
 
       des_title = process_title(org_issue.title, org_issue.component, component_mapping)
+      des_description = f"Original issue url: {org_issue.url}\n\n{org_issue.description}"
 
       # Update workitem relationship (children and parent)
       changing_relationship_param = dict()
@@ -653,16 +823,18 @@ and no sync-back of planning data is performed on the original.
          changing_relationship_param['children'] = org_issue.children
 
       if changing_relationship_param:
-         Logger.log(f"Updating {', '.join([attr.title() for attr in changing_relationship_param.keys()])} relationship", indent=6)
-         des_tracker.update_ticket(dest_issue.id, **changing_relationship_param)
+         Logger.log(f"Updating {', '.join(attr.title() for attr in changing_relationship_param)} relationship", indent=6)
+         des_tracker.update_ticket(dest_issue.id, issue_client=dest_issue.issue_client, **changing_relationship_param)
 
       # Update workitem attributes
       changing_attribute_param = dict()
       if dest_issue.type != org_issue.type:
          changing_attribute_param['type'] = org_issue.type
-      if dest_issue.title != des_title:
+      # Force to update title for Epic work item
+      if dest_issue.title != des_title or org_issue.type == Ticket.Type.Epic:
          changing_attribute_param['title'] = des_title
-      changing_attribute_param['description'] = f"Original issue url: {org_issue.url}\n\n{org_issue.description}"
+      if dest_issue.description != des_description:
+         changing_attribute_param['description'] = des_description
       if dest_issue.labels != updated_labels:
          changing_attribute_param['labels'] = updated_labels
       if des_is_master:
@@ -691,11 +863,10 @@ and no sync-back of planning data is performed on the original.
          elif getattr(des_tracker.tracker_client, "planned_for", None):
             changing_attribute_param['planned_for'] = des_tracker.tracker_client.planned_for
       if org_issue.type == Ticket.Type.Epic:
-         # Force to update title for Epic work item
-         changing_attribute_param['title'] = des_title
-         changing_attribute_param['epic_statement'] = f"Original issue url: {org_issue.url}\n\n{org_issue.description}"
-      Logger.log(f"Syncing {', '.join([attr.title() for attr in changing_attribute_param.keys()])}", indent=6)
-      des_tracker.update_ticket(dest_issue.id, **changing_attribute_param)
+         changing_attribute_param['epic_statement'] = des_description
+      if changing_attribute_param:
+         Logger.log(f"Syncing {', '.join(attr.title() for attr in changing_attribute_param)}", indent=6)
+         des_tracker.update_ticket(dest_issue.id, issue_client=dest_issue.issue_client, **changing_attribute_param)
 
 def SyncIssue():
    """
@@ -705,9 +876,7 @@ Main function to sync issues between tracking systems.
 
 (*no returns*)
    """
-   csv_content = list()
    csv_file = "sync_status.csv"
-   csv_content.append("No., Ticket, Source Link, Destination ID, Stage\n")
    args = process_cli_argument()
    Logger.config(dryrun=args.dryrun)
 
@@ -716,121 +885,153 @@ Main function to sync issues between tracking systems.
    else:
       Logger.log_error("Missing configuration JSON", fatal_error=True)
 
-   # Process component mapping information
-   component_mapping = None
-   if 'component_mapping' in config:
-      component_mapping = config['component_mapping']
-
-   # Process additional labels (version label) for planing print - only for sync issue
-   sprint_version_mapping = None
-   if 'sprint_version_mapping' in config:
-      sprint_version_mapping = config['sprint_version_mapping']
-
-   # Process destination tracker
-   des_tracker = Tracker.create(config['destination'][0])
-   des_tracker_params = copy.deepcopy(config['tracker'][config['destination'][0]])
-   des_is_master_config = des_tracker_params.pop('is_master', False)
-   if 'condition' in des_tracker_params:
-      del des_tracker_params['condition']
-   des_tracker.connect(**des_tracker_params)
-
-   user_management = UserManagement(config['user'])
-
-   # Process source trackers
-   issue_counter = 0
-   error_counter = 0
-   for source in config['source']:
-      new_issue = 0
-      sync_issue = 0
-      Logger.log(f"Process issues from {source.title()}:")
-      tracker = Tracker.create(source)
-      tracker_params = copy.deepcopy(config['tracker'][source])
-      org_is_master_config = tracker_params.pop('is_master', False)
-      # Resolve which tracker is planning master:
-      #   - neither specifies is_master (both false) => des is master (backward-compat)
-      #   - org=True, des not set (false)            => org is master
-      #   - des=True, org any                        => des is master
-      #   - both=True                                => des is master
-      des_is_master = des_is_master_config or not org_is_master_config
-      Logger.log(f"Planning master: {'destination' if des_is_master else 'source'} ({config['destination'][0] if des_is_master else source})", indent=2)
-      if 'condition' in tracker_params:
-         del tracker_params['condition']
-
-      tracker.connect(**tracker_params)
-      list_issue = tracker.get_tickets(**config['tracker'][source]['condition'])
-
-      for issue in list_issue:
-         sync_status = "new"
-         issue_counter += 1
-         Logger.log(issue.__str__(), indent=2)
-         assignee = None
-         if isinstance(issue.assignee, str):
-            assignee = user_management.get_user(issue.assignee, source)
-         elif isinstance(issue.assignee, list) and len(issue.assignee):
-            assignee = user_management.get_user(issue.assignee[0], source)
-
-         if issue.is_synced:
-            # update original issue on source tracker with planing from destination
-            try:
-               dest_issue = des_tracker.get_ticket(issue.destination_id)
-            except Exception as reason:
-               csv_content.append(f"{issue_counter}, {issue.tracker.title()} {issue.id}, {issue.url}, {config['destination'][0]} {issue.destination_id}, not found\n")
-               Logger.log_warning(f"{config['destination'][0].title()} issue {issue.destination_id} cannot be found. Reason: {reason}", indent=4)
-               error_counter += 1
-               continue
-
-            if args.nosync and 'nosync' in issue.labels:
-               sync_status = "closed nosync"
-               if not args.dryrun:
+   # Sync status is streamed to csv file while syncing, it is opened after the configuration
+   # is validated and always closed (flushed) even if the sync is aborted
+   csv_handle = None
+   csv_writer = None
+   if args.csv:
+      csv_handle = open(csv_file, 'w', buffering=65536, encoding='utf-8', newline='')
+      csv_writer = csv.writer(csv_handle, lineterminator="\n")
+      csv_writer.writerow(("No.", "Ticket", "Source Link", "Destination ID", "Stage"))
+
+   try:
+      des_tracker_type = config['destination'][0]
+      des_tracker_title = des_tracker_type.title()
+
+      # Process component mapping information
+      component_mapping = config.get('component_mapping')
+
+      # Process additional labels (version label) for planing print - only for sync issue
+      sprint_version_mapping = config.get('sprint_version_mapping')
+
+      # Process destination tracker
+      des_tracker = Tracker.create(des_tracker_type)
+      des_tracker_config = config['tracker'][des_tracker_type]
+      des_is_master_config = des_tracker_config.get('is_master', False)
+      des_tracker.connect(**get_tracker_connect_params(des_tracker_config))
+
+      user_management = UserManagement(config['user'])
+
+      # Process source trackers
+      issue_counter = 0
+      error_counter = 0
+      for source in config['source']:
+         new_issue = 0
+         sync_issue = 0
+         source_title = source.title()
+         Logger.log(f"Process issues from {source_title}:")
+         tracker = Tracker.create(source)
+         tracker_config = config['tracker'][source]
+         org_is_master_config = tracker_config.get('is_master', False)
+         # Resolve which tracker is planning master:
+         #   - neither specifies is_master (both false) => des is master (backward-compat)
+         #   - org=True, des not set (false)            => org is master
+         #   - des=True, org any                        => des is master
+         #   - both=True                                => des is master
+         des_is_master = des_is_master_config or not org_is_master_config
+         Logger.log(f"Planning master: {'destination' if des_is_master else 'source'} ({des_tracker_type if des_is_master else source})", indent=2)
+
+         tracker.connect(**get_tracker_connect_params(tracker_config))
+         list_issue = tracker.get_tickets(**tracker_config.get('condition', {}))
+
+         # Destination issues prefetched in bulk for the issues of the currently synced type
+         dest_issues = dict()
+
+         # Sync a single issue, returns its sync status, the destination issue ID and
+         # the result kind ("new", "synced", "error" or None when nothing is changed)
+         def sync_single_issue(issue):
+            Logger.log(str(issue), indent=2)
+            # nosync label is only checked when --nosync is given
+            is_nosync = args.nosync and 'nosync' in issue.label_set
+            assignee = None
+            if isinstance(issue.assignee, str):
+               assignee = user_management.get_user(issue.assignee, source)
+            elif isinstance(issue.assignee, list) and len(issue.assignee):
+               assignee = user_management.get_user(issue.assignee[0], source)
+
+            if issue.is_synced:
+               des_id = issue.destination_id
+               # update original issue on source tracker with planing from destination
+               try:
+                  if des_id in dest_issues:
+                     dest_issue = dest_issues[des_id]
+                     if dest_issue is None:
+                        # the reason is already logged when the destination issues are prefetched
+                        raise Exception("it is not retrieved by the bulk query")
+                  else:
+                     dest_issue = des_tracker.get_ticket(des_id)
+               except Exception as reason:
+                  Logger.log_warning(f"{des_tracker_title} issue {des_id} cannot be found. Reason: {reason}", indent=4)
+                  return "not found", des_id, "error"
+
+               if is_nosync:
+                  if args.dryrun:
+                     return "closed nosync", des_id, None
                   try:
-                     Logger.log(f"Closing {dest_issue.tracker.title()} issue {dest_issue.id} due to 'nosync'", indent=4)
+                     Logger.log(f"Closing {des_tracker_title} issue {dest_issue.id} due to 'nosync'", indent=4)
                      des_tracker.update_ticket_state(dest_issue, Status.closed)
-                     sync_issue += 1
+                     return "closed nosync", des_id, "synced"
                   except Exception as reason:
-                     Logger.log_error(f"Cannot close {dest_issue.tracker.title()} issue {dest_issue.id}. {reason}", indent=4)
-                     error_counter += 1
-                     sync_status = "error"
-            else:
-               sync_status = "synced"
-               if not args.dryrun:
+                     Logger.log_error(f"Cannot close {des_tracker_title} issue {dest_issue.id}. {reason}", indent=4)
+                     return "error", des_id, "error"
+               else:
+                  if args.dryrun:
+                     return "synced", des_id, None
                   try:
                      process_sync_issues(issue, tracker, dest_issue, des_tracker, assignee, user_management, component_mapping, sprint_version_mapping, args.status_only, des_is_master)
-                     sync_issue += 1
+                     return "synced", des_id, "synced"
                   except Exception as reason:
-                     Logger.log_error(f"Cannot sync {dest_issue.tracker.title()} issue {dest_issue.id}. {reason}", indent=4)
-                     error_counter += 1
-                     sync_status = "error"
-            csv_content.append(f"{issue_counter}, {issue.tracker.title()} {issue.id}, {issue.url}, {config['destination'][0]} {issue.destination_id}, {sync_status}\n")
+                     Logger.log_error(f"Cannot sync {des_tracker_title} issue {dest_issue.id}. {reason}", indent=4)
+                     return "error", des_id, "error"
 
-         else:
-            res_id = ""
-            if args.nosync and 'nosync' in issue.labels:
-               sync_status = "nosync"
-            elif args.status_only:
-               sync_status = "skipped"
             else:
+               if is_nosync:
+                  return "nosync", "", None
+               elif args.status_only:
+                  return "skipped", "", None
+               elif args.dryrun:
+                  return "new", "", None
                # create new issue on destination tracker
-               if not args.dryrun:
-                  try:
-                     update_issue_relationship(tracker, issue, des_tracker.TYPE)
-                     res_id = process_new_issue(issue, des_tracker, assignee, component_mapping)
+               try:
+                  update_issue_relationship(tracker, issue, des_tracker.TYPE)
+                  res_id = process_new_issue(issue, des_tracker, assignee, component_mapping)
+                  return "new", res_id, "new"
+               except Exception as reason:
+                  Logger.log_error(f"Cannot create new {des_tracker_title} issue. {reason}", indent=4)
+                  return "error", "", "error"
+
+         with ThreadPoolExecutor(max_workers=max(args.jobs, 1)) as executor:
+            # Issues of the same type are synced concurrently, but the order between types is kept
+            # because the relationship (parent/children) requires the related issues to be synced before
+            for _, group_issues in groupby(list_issue, key=attrgetter('type')):
+               group_issues = list(group_issues)
+               # Prefetch destination issues of already synced issues in bulk when the tracker supports bulk queries,
+               # otherwise each destination issue is requested by its sync job. It is done per type so that
+               # the changes of previously synced types (e.g. children of Epic) are already contained
+               dest_issues.clear()
+               if des_tracker.SUPPORT_BULK_QUERY:
+                  dest_issues.update(des_tracker.get_tickets_by_ids([issue.destination_id for issue in group_issues
+                                                                      if issue.is_synced]))
+               for issue, (sync_status, des_id, result) in zip(group_issues, executor.map(sync_single_issue, group_issues)):
+                  issue_counter += 1
+                  if result == "new":
                      new_issue += 1
-                  except Exception as reason:
-                     Logger.log_error(f"Cannot create new {config['destination'][0].title()} issue. {reason}", indent=4)
+                  elif result == "synced":
+                     sync_issue += 1
+                  elif result == "error":
                      error_counter += 1
-                     sync_status = "error"
-
-            csv_content.append(f"{issue_counter}, {issue.tracker.title()} {issue.id}, {issue.url}, {config['destination'][0]} {res_id}, {sync_status}\n")
+                  if csv_writer:
+                     csv_writer.writerow((issue_counter, f"{source_title} {issue.id}", issue.url, f"{des_tracker_type} {des_id}", sync_status))
 
-      Logger.log(f"{new_issue + sync_issue} {source.title()} issues has been synced (includes {new_issue} new creation) to {config['destination'][0]} successfully!\n", indent=2)
-
-   if args.csv:
-      write_csv_files(csv_file, csv_content)
+         Logger.log(f"{new_issue + sync_issue} {source_title} issues has been synced (includes {new_issue} new creation) to {des_tracker_type} successfully!\n", indent=2)
+   finally:
+      if csv_handle:
+         csv_handle.close()
 
    if error_counter:
-      Logger.log(f"{issue_counter - error_counter} issues has been synced to {config['destination'][0]} successfully! {error_counter} issues are not synced due to error.")
+      Logger.log(f"{issue_counter - error_counter} issues has been synced to {des_tracker_type} successfully! {error_counter} issues are not synced due to error.")
    else:
-      Logger.log(f"All {issue_counter} issues has been synced to {config['destination'][0]} successfully!")
+      Logger.log(f"All {issue_counter} issues has been synced to {des_tracker_type} successfully!")
 
 if __name__ == "__main__":
    SyncIssue()
\ No newline at end of file
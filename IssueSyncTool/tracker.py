@@ -1,12 +1,214 @@
-from IssueSyncTool.rtc_client import RTCClient
-from github import Github, Auth
-from jira import JIRA
-from gitlab import Gitlab
 from abc import ABC, abstractmethod
 from typing import Union, Optional, Callable
-from IssueSyncTool.utils import REGEX_PRIORITY_LABEL, REGEX_STORY_POINT_LABEL
+from functools import lru_cache
+from IssueSyncTool.utils import REGEX_PRIORITY_LABEL, REGEX_STORY_POINT_LABEL, RTC_PRIORITY_PATTERN
+from concurrent.futures import ThreadPoolExecutor
+from collections import deque
+from itertools import chain
 import re
+import sys
+import threading
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# HTTP response cache is optional, it is only required when 'http_cache' is configured
+try:
+   from cachecontrol import CacheControlAdapter
+   from cachecontrol.caches.file_cache import FileCache
+except ImportError:
+   CacheControlAdapter = None
+
+PRIORITY_LABEL_PATTERN = re.compile(REGEX_PRIORITY_LABEL)
+STORY_POINT_LABEL_PATTERN = re.compile(REGEX_STORY_POINT_LABEL)
+# Title of already synced ticket, e.g. `[ 1234 ] Title of already synced ticket`
+SYNCED_TITLE_PATTERN = re.compile(r"\[\s*(\d+)\s*\]")
+JIRA_SPRINT_NAME_PATTERN = re.compile(r"name=([^,]*)")
+
+def intern_string(value):
+   """
+Intern the given value if it is a string so that equal strings share one object.
+
+**Arguments:**
+
+* ``value``
+
+  / *Condition*: required / *Type*: Any /
+
+  The value to be interned.
+
+**Returns:**
+
+* ``value``
+
+  / *Type*: Any /
+
+  The interned string or the given value if it is not a string.
+   """
+   return sys.intern(value) if isinstance(value, str) else value
+
+def log_warning(msg: str, indent: int = 4):
+   """
+Write a warning message with the Logger of the sync tool.
+
+**Arguments:**
+
+* ``msg``
+
+  / *Condition*: required / *Type*: str /
+
+  Warning message which is written to output.
+
+* ``indent``
+
+  / *Condition*: optional / *Type*: int / *Default*: 4 /
+
+  Offset indent.
+   """
+   # Logger is imported when it is used because sync_issue imports this module
+   from IssueSyncTool.sync_issue import Logger
+   Logger.log_warning(msg, indent=indent)
+
+def create_http_session(pool_maxsize: int = 10, retry_methods=Retry.DEFAULT_ALLOWED_METHODS,
+                        cache_dir: str = None) -> requests.Session:
+   """
+Create a keep-alive HTTP session with connection pooling and retry for transient errors.
+
+**Arguments:**
+
+* ``pool_maxsize``
+
+  / *Condition*: optional / *Type*: int / *Default*: 10 /
+
+  Maximum number of connections to keep per host.
+
+* ``retry_methods``
+
+  / *Condition*: optional / *Type*: frozenset / *Default*: Retry.DEFAULT_ALLOWED_METHODS /
+
+  HTTP methods which are retried, None to retry all methods.
+
+* ``cache_dir``
+
+  / *Condition*: optional / *Type*: str / *Default*: None /
+
+  Directory to cache the HTTP responses, cached responses are revalidated
+  with conditional requests (ETag/Last-Modified). No cache if not given.
+
+**Returns:**
+
+* ``session``
+
+  / *Type*: requests.Session /
+
+  The HTTP session.
+   """
+   session = requests.Session()
+   retry = Retry(total=3,
+                 backoff_factor=0.3,
+                 status_forcelist=(429, 500, 502, 503, 504),
+                 allowed_methods=retry_methods)
+   if cache_dir:
+      if CacheControlAdapter is None:
+         raise Exception("Package 'cachecontrol' is required to use the HTTP response cache.")
+      # caching adapter replaces the default one, so it gets the same pool size and retries
+      adapter = CacheControlAdapter(cache=FileCache(cache_dir), pool_maxsize=pool_maxsize, max_retries=retry)
+   else:
+      adapter = HTTPAdapter(pool_maxsize=pool_maxsize, max_retries=retry)
+   session.mount("http://", adapter)
+   session.mount("https://", adapter)
+   return session
+
+@lru_cache(maxsize=512)
+def parse_priority_label(label: str) -> Optional[int]:
+   """
+Parse priority level from a single label, the result is cached per label.
+
+**Arguments:**
+
+* ``label``
+
+  / *Condition*: required / *Type*: str /
+
+  The label, e.g. `prio 1`.
+
+**Returns:**
+
+* ``priority``
+
+  / *Type*: int /
+
+  The priority level (limited to 5 - lowest) or None if label is not a priority label.
+   """
+   priority_label = PRIORITY_LABEL_PATTERN.match(label)
+   if priority_label:
+      # Limit priority level to 5 (lowest)
+      return min(int(priority_label[1]), 5)
+   return None
+
+@lru_cache(maxsize=512)
+def parse_story_point_label(label: str) -> Optional[int]:
+   """
+Parse story points from a single label, the result is cached per label.
+
+**Arguments:**
+
+* ``label``
+
+  / *Condition*: required / *Type*: str /
+
+  The label, e.g. `3 pts`.
+
+**Returns:**
+
+* ``story_points``
+
+  / *Type*: int /
+
+  The story points or None if label is not a story point label.
+   """
+   story_point_label = STORY_POINT_LABEL_PATTERN.match(label)
+   if story_point_label:
+      return int(story_point_label[1])
+   return None
+
+def get_gitlab_user_id(gitlab_client, username: str) -> int:
+   """
+Get the ID of a Gitlab user, the result is cached in the ``user_ids`` dictionary
+of the Gitlab client (set by ``GitlabTracker.connect``) so that the cache is
+released together with the client.
+
+**Arguments:**
+
+* ``gitlab_client``
+
+  / *Condition*: required / *Type*: gitlab.Gitlab /
+
+  The Gitlab client.
+
+* ``username``
+
+  / *Condition*: required / *Type*: str /
+
+  The username of the user.
+
+**Returns:**
+
+* ``user_id``
+
+  / *Type*: int /
+
+  The ID of the user.
+   """
+   user_ids = getattr(gitlab_client, "user_ids", None)
+   if user_ids is None:
+      return gitlab_client.users.list(username=username)[0].id
+   user_id = user_ids.get(username)
+   if user_id is None:
+      user_id = gitlab_client.users.list(username=username)[0].id
+      # setdefault is atomic, the ID requested first by concurrent sync jobs is kept
+      user_id = user_ids.setdefault(username, user_id)
+   return user_id
 
 class Status:
    """
@@ -35,12 +237,20 @@ Class representing the status of issues in different tracker systems.
       }
    }
 
+   # Reverse mapping from normalized status to native status of each tracker.
+   # The first native status is kept when multiple ones are mapped to the same normalized status.
+   STATUS_MAPPING_REVERSE = {
+      tracker_type: {normalized: native for native, normalized in reversed(mapping.items())}
+      for tracker_type, mapping in STATUS_MAPPING.items()
+   }
+
    open = "Open"
    inProgress = "In Progress"
    readyForAcceptance = "Ready for Acceptance"
    closed = "Closed"
 
    @staticmethod
+   @lru_cache(maxsize=64)
    def normalize_issue_status(tracker_type: str, native_status: str) -> str:
       """
 Normalize the issue status to a standard format.
@@ -67,15 +277,18 @@ Normalize the issue status to a standard format.
 
   The normalized status of the issue.
       """
-      if tracker_type not in Status.STATUS_MAPPING.keys():
+      mapping = Status.STATUS_MAPPING.get(tracker_type)
+      if mapping is None:
          raise ValueError(f"Unsupported tracker type '{tracker_type}'")
 
-      if native_status not in Status.STATUS_MAPPING[tracker_type].keys():
+      normalized_status = mapping.get(native_status)
+      if normalized_status is None:
          raise ValueError(f"Unsupported status '{native_status}' for {tracker_type.title()} issue")
 
-      return Status.STATUS_MAPPING[tracker_type][native_status]
+      return normalized_status
 
    @staticmethod
+   @lru_cache(maxsize=64)
    def get_native_status(tracker_type: str, normalized_status: str) -> str:
       """
 Get the native status from the normalized status.
@@ -102,29 +315,39 @@ Get the native status from the normalized status.
 
   The native status of the issue.
       """
-      if tracker_type not in Status.STATUS_MAPPING.keys():
+      reverse_mapping = Status.STATUS_MAPPING_REVERSE.get(tracker_type)
+      if reverse_mapping is None:
          raise Exception(f"Unsupported tracker type {tracker_type}")
 
-      if normalized_status not in Status.STATUS_MAPPING[tracker_type].values():
+      native_status = reverse_mapping.get(normalized_status)
+      if native_status is None:
          raise Exception(f"Unsupported status {normalized_status}")
 
-      for key, val in Status.STATUS_MAPPING[tracker_type].items():
-         if val == normalized_status:
-            return key
+      return native_status
 
 class Ticket:
    """
 Normalized Ticket with required information for syncing between trackers.
    """
+   # Fixed set of attributes avoids a per-instance __dict__ for the many tickets of a sync run
+   __slots__ = ("tracker", "id", "title", "description", "assignee", "url", "status",
+                "createdDate", "updatedDate", "component", "version", "sprint",
+                "_labels", "_label_set", "story_point", "priority", "destination_id",
+                "issue_client", "type", "children", "parent", "is_synced")
+
+   class TypeMeta(type):
+      """
+Metaclass to support membership test (e.g. ``"Epic" in Ticket.Type``) on the class itself.
+      """
+      def __contains__(cls, item):
+         return item in cls.VALUES
 
-   class Type:
+   class Type(metaclass=TypeMeta):
       Epic = "Epic"
       # Epic = "Program Epic"
       Story = "Story"
 
-      @classmethod
-      def __contains__(cls, item):
-         return item in cls.__dict__.values()
+      VALUES = frozenset((Epic, Story))
 
    def __init__(self,
                 tracker: str,
@@ -145,7 +368,7 @@ Normalized Ticket with required information for syncing between trackers.
                 destination_id: Optional[str] = None,
                 issue_client: Callable = None,
                 type: Optional[str] = Type.Story,
-                children: Optional[list] = [],
+                children: Optional[list] = None,
                 parent: Optional[str] = None):
       """
 Initialize a new Ticket.
@@ -242,16 +465,18 @@ Initialize a new Ticket.
 
   The issue client for interacting with the tracker.
       """
-      self.tracker = tracker
+      # Tracker type, status, component and labels have a small vocabulary,
+      # interning them lets all tickets share the same string objects.
+      self.tracker = intern_string(tracker)
       self.id = original_id
       self.title = title
       self.description = description
       self.assignee = assignee
       self.url = url
-      self.status = status
+      self.status = intern_string(status)
       self.createdDate = createdDate
       self.updatedDate = updatedDate
-      self.component = component
+      self.component = intern_string(component)
       self.version = version
       self.sprint = sprint
       self.labels = labels if labels is not None else []
@@ -260,7 +485,7 @@ Initialize a new Ticket.
       self.destination_id = destination_id
       self.issue_client = issue_client
       self.type = type
-      self.children = children
+      self.children = children if children is not None else []
       self.parent = parent
       self.is_synced = self.is_synced_issue()
 
@@ -278,6 +503,25 @@ Return a string representation of the Ticket object.
       """
       return (f"Ticket ({self.tracker.capitalize()}: ID={self.id}, type={self.type}, title=\"{self.title}\")")
 
+   @property
+   def labels(self) -> list:
+      """
+The labels associated with the ticket.
+      """
+      return self._labels
+
+   @labels.setter
+   def labels(self, labels: list):
+      self._labels = [intern_string(label) for label in labels]
+      self._label_set = frozenset(self._labels)
+
+   @property
+   def label_set(self) -> frozenset:
+      """
+The labels associated with the ticket as frozenset for fast membership test.
+      """
+      return self._label_set
+
    def update(self, **kwargs):
       """
 Update issue on tracker with following supported attributes:
@@ -293,16 +537,10 @@ Update issue on tracker with following supported attributes:
 
   A dictionary of attributes to update the ticket with.
       """
-      if self.issue_client:
+      update_method = self.UPDATE_METHODS.get(self.tracker)
+      if self.issue_client and update_method:
          try:
-            if self.tracker == "gitlab":
-               self._update_gitlab_issue(**kwargs)
-            elif self.tracker == "github":
-               self._update_github_issue(**kwargs)
-            elif self.tracker == "jira":
-               self._update_jira_issue(**kwargs)
-            elif self.tracker == 'rtc':
-               self._update_rtc_issue(**kwargs)
+            update_method(self, **kwargs)
          except Exception as reason:
             raise Exception(f"Failed to update {self.tracker.title()} issue {self.id}. Reason: {reason}")
       else:
@@ -313,7 +551,7 @@ Update issue on tracker with following supported attributes:
          if attr == "assignee":
             if val:
                try:
-                  assignee_id = self.issue_client.manager.gitlab.users.list(username=val)[0].id
+                  assignee_id = get_gitlab_user_id(self.issue_client.manager.gitlab, val)
                except Exception as reason:
                   raise Exception(f"Could not found user name '{val}' in gitlab project. Reason: {reason}")
                self.issue_client.assignee_ids = [assignee_id]
@@ -334,22 +572,25 @@ Update issue on tracker with following supported attributes:
          assignee_val = {"name": kwargs['assignee']}
          kwargs['assignee'] = assignee_val
       if 'title' in kwargs:
-         title_val = kwargs['title']
-         kwargs['summary'] = title_val
-         del kwargs['title']
+         kwargs['summary'] = kwargs.pop('title')
       if 'labels' in kwargs:
+         # JIRA label does not allow space
          kwargs['fields'] = {
-            'labels': list()
+            'labels': [label.replace(" ", "_") for label in kwargs.pop('labels')]
          }
-         # JIRA label does not allow space
-         for label in kwargs['labels']:
-            kwargs['fields']['labels'].append(label.replace(" ", "_"))
-         del kwargs['labels']
       self.issue_client.update(**kwargs)
 
    def _update_rtc_issue(self, **kwargs):
       self.issue_client.update_workitem(self.id, **kwargs)
 
+   # Update method of each tracker type
+   UPDATE_METHODS = {
+      "gitlab": _update_gitlab_issue,
+      "github": _update_github_issue,
+      "jira": _update_jira_issue,
+      "rtc": _update_rtc_issue
+   }
+
    def is_synced_issue(self):
       """
 Verify whether the ticket is already synced or not.
@@ -365,7 +606,7 @@ E.g `[ 1234 ] Title of already synced ticket`
 
   Indicates if the ticket is already synced.
       """
-      match = re.search(r"^\[\s*(\d+)\s*\]", self.title)
+      match = SYNCED_TITLE_PATTERN.match(self.title)
       if match:
          self.destination_id = match.group(1)
          return True
@@ -380,10 +621,17 @@ Abstraction class of Tracker Service.
    """
    # Number of hours equivalent to one story point.
    HOUR_PER_STORYPOINT = 8
+   SECONDS_PER_STORYPOINT = 3600 * HOUR_PER_STORYPOINT
 
    # Default color for sprint labels.
    SPRINT_LABEL_COLOR = "#007bff"  # calm blue
 
+   # Registry of tracker types and their classes, filled when subclasses are defined
+   TRACKERS = dict()
+
+   # Whether get_tickets_by_ids gets multiple tickets with bulk queries instead of one by one
+   SUPPORT_BULK_QUERY = False
+
    PRIORITY_LEVEL = {
       "1": ["Highest", "Very High"],
       "2": ["High"],
@@ -392,11 +640,24 @@ Abstraction class of Tracker Service.
       "5": ["Lowest", "Very Low"]
    }
 
+   # Reverse mapping from priority name to its level
+   PRIORITY_NAME_TO_LEVEL = {name: int(level) for level, names in PRIORITY_LEVEL.items() for name in names}
+
+   def __init_subclass__(cls, **kwargs):
+      """
+Register the tracker class of the subclass with its type.
+      """
+      super().__init_subclass__(**kwargs)
+      if "TYPE" in cls.__dict__:
+         TrackerService.TRACKERS[cls.TYPE] = cls
+
    def __init__(self):
       """
 Initialize the TrackerService instance.
       """
       self.tracker_client = None
+      # Guards the caches which are checked and updated in several steps when issues are synced concurrently
+      self.cache_lock = threading.Lock()
 
    @abstractmethod
    def connect(self, *args, **kwargs):
@@ -451,6 +712,56 @@ Method to get all tickets which satisfy the given condition/query.
       """
       pass
 
+   def get_tickets_by_ids(self, ids: list) -> dict:
+      """
+Method to get multiple tickets by their IDs.
+
+Trackers which support bulk queries override this method to reduce the number
+of requests, the default implementation gets the tickets one by one.
+Tickets which cannot be retrieved due to a request error are logged as warning
+and mapped to None, other errors are raised.
+
+**Arguments:**
+
+* ``ids``
+
+  / *Condition*: required / *Type*: list /
+
+  The IDs of the tickets.
+
+**Returns:**
+
+* ``tickets``
+
+  / *Type*: dict /
+
+  A dictionary of the retrieved tickets with the given IDs as keys.
+      """
+      tickets = dict()
+      request_errors = self.get_request_errors()
+      for id in dict.fromkeys(ids):
+         try:
+            tickets[id] = self.get_ticket(id)
+         except request_errors as reason:
+            log_warning(f"{self.TYPE} issue {id} cannot be retrieved. Reason: {reason}")
+            tickets[id] = None
+      return tickets
+
+   def get_request_errors(self) -> tuple:
+      """
+Method to get the exception types which are raised by the tracker client
+when a ticket is not found or a request to the tracker fails.
+
+**Returns:**
+
+* ``request_errors``
+
+  / *Type*: tuple /
+
+  The exception types of request errors.
+      """
+      return (requests.exceptions.RequestException,)
+
    @abstractmethod
    def create_ticket(self, ticket: Ticket) -> str:
       """
@@ -474,6 +785,35 @@ Method to create a new ticket on the tracker system.
       """
       pass
 
+   def create_labels(self, label_names: list, color: str = None, repository: str = None):
+      """
+Create multiple labels, each label is created once even if it is given several times.
+
+**Arguments:**
+
+* ``label_names``
+
+  / *Condition*: required / *Type*: list /
+
+  The names of the labels.
+
+* ``color``
+
+  / *Condition*: optional / *Type*: str / *Default*: None /
+
+  The color of the labels.
+
+* ``repository``
+
+  / *Condition*: optional / *Type*: str / *Default*: None /
+
+  The repository name.
+      """
+      # Only a few labels are created per issue, they are created one after another
+      # because create_label shares the cache of existing labels
+      for label_name in dict.fromkeys(label_names):
+         self.create_label(label_name, color, repository)
+
    def exclude_ticket_by_condition(self, ticket: Ticket, exclude_condition=None) -> bool:
       """
 Process to verify whether the given ticket satisfies the exclude conditions.
@@ -500,16 +840,50 @@ Process to verify whether the given ticket satisfies the exclude conditions.
 
   Indicates if the ticket is excluded based on the given conditions.
       """
-      if exclude_condition:
-         for key, value in exclude_condition.items():
-            if key in ["assignee", "labels"]:
-               if not getattr(ticket, key):
-                  if value == "empty": return False
-               else:
-                  if value in getattr(ticket, key): return False
-            else:
-               if getattr(ticket, key) == value: return False
-      return True
+      return self.compile_exclude_condition(exclude_condition)(ticket)
+
+   @staticmethod
+   def compile_exclude_condition(exclude_condition=None) -> Callable[[Ticket], bool]:
+      """
+Compile the exclude conditions once into a predicate which can be applied to many tickets.
+
+**Arguments:**
+
+* ``exclude_condition``
+
+  / *Condition*: optional / *Type*: dict / *Default*: None /
+
+  A dictionary of conditions to exclude the ticket.
+
+**Returns:**
+
+* ``predicate``
+
+  / *Type*: Callable[[Ticket], bool] /
+
+  Function which returns False if the given ticket is excluded based on the given conditions.
+      """
+      list_checks = list()
+      for key, value in (exclude_condition or {}).items():
+         # labels and assignee conditions can be a string or an array of strings
+         values = tuple(value) if isinstance(value, list) else (value,)
+         if key == "labels":
+            list_checks.append(lambda ticket, values=values: any(val in ticket.label_set for val in values)
+                                                             if ticket.labels else ("empty" in values))
+         elif key == "assignee":
+            list_checks.append(lambda ticket, values=values: any(val in ticket.assignee for val in values)
+                                                             if ticket.assignee else ("empty" in values))
+         else:
+            list_checks.append(lambda ticket, key=key, value=value: getattr(ticket, key) == value)
+
+      if not list_checks:
+         # Nothing is excluded, avoid the generator for each ticket of unfiltered syncs
+         return lambda ticket: True
+
+      def is_not_excluded(ticket: Ticket) -> bool:
+         return not any(check(ticket) for check in list_checks)
+
+      return is_not_excluded
 
    def get_priority_from_labels(self, labels: list) -> int:
       """
@@ -533,12 +907,12 @@ Example of priority labels: `prio 1`, `prio 2`, ...
   The priority extracted from the labels.
       """
       for label in labels:
-         priority_label = re.match(REGEX_PRIORITY_LABEL, label)
-         if priority_label:
-            # Limit priority level to 5 (lowest)
-            if int(priority_label[1]) > 5:
-               return 5
-            return int(priority_label[1])
+         # cheap prefix check avoids the regex matching for most of labels
+         if not label.startswith("prio"):
+            continue
+         priority = parse_priority_label(label)
+         if priority is not None:
+            return priority
 
       return None
 
@@ -564,13 +938,48 @@ Example of story point labels: `1 pts`, `2 pts`, ...
   The story points extracted from the labels.
       """
       for label in labels:
-         # story_point_label = re.match(r'(\d+)\s*point(s)?', label)
-         story_point_label = re.match(REGEX_STORY_POINT_LABEL, label)
-         if story_point_label:
-            return int(story_point_label[1])
+         # story point label starts with a digit, e.g. `3 pts`
+         if not label[:1].isdigit():
+            continue
+         story_point = parse_story_point_label(label)
+         if story_point is not None:
+            return story_point
 
       return 0
 
+   def get_planning_from_labels(self, labels: list) -> tuple:
+      """
+Process to get both priority and story points from issue labels in a single pass.
+
+**Arguments:**
+
+* ``labels``
+
+  / *Condition*: required / *Type*: list /
+
+  A list of labels associated with the issue.
+
+**Returns:**
+
+* ``(priority, story_points)``
+
+  / *Type*: tuple /
+
+  The priority (None if not found) and story points (0 if not found) extracted from the labels.
+      """
+      priority = None
+      story_point = None
+      for label in labels:
+         # cheap prefix checks avoid the regex matching for most of labels
+         if priority is None and label.startswith("prio"):
+            priority = parse_priority_label(label)
+         elif story_point is None and label[:1].isdigit():
+            story_point = parse_story_point_label(label)
+         if priority is not None and story_point is not None:
+            break
+
+      return priority, story_point if story_point is not None else 0
+
    @classmethod
    def time_estimate_to_story_point(cls, seconds: int) -> int:
       """
@@ -594,7 +1003,7 @@ Convert given estimated time (in seconds) to story points.
       """
       if not isinstance(seconds, int) or seconds < 0:
          raise ValueError("seconds must be a non-negative integer")
-      return int(seconds / 3600 / cls.HOUR_PER_STORYPOINT)
+      return seconds // cls.SECONDS_PER_STORYPOINT
 
 class JiraTracker(TrackerService):
    """
@@ -602,6 +1011,26 @@ Tracker client to integrate with issues on Jira.
    """
    TYPE = "jira"
 
+   # Maximum number of pooled keep-alive connections, enough for the concurrent sync jobs
+   POOL_MAXSIZE = 16
+
+   # Maximum number of concurrent search requests
+   MAX_WORKERS = 8
+
+   # Maximum number of issue keys per bulk JQL query
+   BULK_QUERY_SIZE = 100
+   SUPPORT_BULK_QUERY = True
+
+   # Page size of JQL search, the server may cap it to a lower value
+   SEARCH_PAGE_SIZE = 1000
+
+   # Issue fields which are required to normalize a Jira issue
+   SEARCH_FIELDS = ",".join(["summary", "description", "assignee", "status", "components",
+                             "priority", "labels", "issuetype",
+                             "customfield_11420",   # Epic Link
+                             "customfield_10224",   # Story Points
+                             "customfield_10821"])  # Sprint
+
    def __init__(self):
       """
 Initialize the JiraTracker instance.
@@ -631,17 +1060,19 @@ Normalize a Jira ticket to Ticket object.
 
   A list of Ticket objects created from the issue data.
       """
+      fields = issue.raw['fields']
+      assignee = fields.get('assignee')
       return Ticket(self.TYPE,
                      issue.key,
-                     issue.raw['fields']['summary'],
-                     issue.raw['fields']['description'],
-                     issue.raw['fields']['assignee']['name'] if issue.raw['fields']['assignee'] else None,
+                     fields['summary'],
+                     fields.get('description'),
+                     assignee['name'] if assignee else None,
                      f"{self.hostname}/browse/{issue.key}",
-                     Status.normalize_issue_status(self.TYPE, issue.raw['fields']['status']['name']),
+                     Status.normalize_issue_status(self.TYPE, fields['status']['name']),
                      self.__get_component(issue),
                      priority=self.get_priority(issue),
                      story_point=self.get_story_point(issue),
-                     labels=issue.raw['fields']['labels'],
+                     labels=fields['labels'],
                      issue_client=issue,
                      type=self.__get_issue_type(issue),
                      parent=self.__get_parent_epic(issue),
@@ -659,9 +1090,10 @@ Normalize a Jira ticket to Ticket object.
          return Ticket.Type.Story
 
    def __get_parent_epic(self, issue):
-      if 'customfield_11420' in issue.raw['fields'] and issue.raw['fields']['customfield_11420']:
+      epic_id = issue.raw['fields'].get('customfield_11420')
+      if epic_id:
          return {
-            "id": issue.raw['fields']['customfield_11420']
+            "id": epic_id
          }
       return None
 
@@ -670,9 +1102,25 @@ Normalize a Jira ticket to Ticket object.
       # It requires another JQL to search the children issue(s): "Epic Link" = {issue.key}
       return []
 
+   @staticmethod
+   def __jql_value(val: str) -> str:
+      # Backslash and quote inside a quoted JQL value are escaped with backslash
+      return "'" + str(val).replace("\\", "\\\\").replace("'", "\\'") + "'"
+
+   @staticmethod
+   def __jql_clause(key: str, val: Union[str, list], negate: bool = False) -> str:
+      # Values are always quoted for both include and exclude conditions
+      if isinstance(val, list):
+         operator = "not in" if negate else "in"
+         list_val = ",".join(JiraTracker.__jql_value(v) for v in val)
+         return f"{key} {operator} ({list_val})"
+      operator = "!=" if negate else "="
+      return f"{key} {operator} {JiraTracker.__jql_value(val)}"
+
    def __get_component(self, issue):
-      if len(issue.raw['fields']['components']) > 0:
-         return issue.raw['fields']['components'][0]['name']
+      components = issue.raw['fields'].get('components')
+      if components:
+         return components[0]['name']
       return None
 
    def connect(self, project: str, token: str, hostname: str, board_id: int=None):
@@ -702,7 +1150,29 @@ Connect to the Jira tracker.
       self.project = project
       self.hostname = hostname
       self.board_id = board_id
+      # SDK of each tracker is imported only when the tracker is used
+      from jira import JIRA
       self.tracker_client = JIRA(hostname, token_auth=token)
+      # JIRA client keeps its own retry logic, only the connection pool is enlarged
+      adapter = HTTPAdapter(pool_maxsize=self.POOL_MAXSIZE)
+      self.tracker_client._session.mount("http://", adapter)
+      self.tracker_client._session.mount("https://", adapter)
+
+   def get_request_errors(self) -> tuple:
+      """
+Get the exception types which are raised by the Jira client when a ticket
+is not found or a request to Jira fails.
+
+**Returns:**
+
+* ``request_errors``
+
+  / *Type*: tuple /
+
+  The exception types of request errors.
+      """
+      from jira.exceptions import JIRAError
+      return (JIRAError, requests.exceptions.RequestException)
 
    def get_ticket(self, id: str) -> Ticket:
       """
@@ -724,7 +1194,7 @@ Get a ticket by its ID.
 
   The ticket object.
       """
-      issue = self.tracker_client.issue(id)
+      issue = self.tracker_client.issue(id, fields=self.SEARCH_FIELDS)
       return self.__normalize_issue(issue)
 
    def get_tickets(self, **kwargs) -> list[Ticket]:
@@ -747,37 +1217,83 @@ Get tickets from the Jira tracker.
 
   A list of tickets that satisfy the given conditions.
       """
-      list_issues = list()
-      jql = list()
-      jql.append(f'project={self.project}')
-      exclude_condition = None
-      if 'exclude' in kwargs:
-         exclude_condition = kwargs['exclude']
-         del kwargs['exclude']
-         for key, val in exclude_condition.items():
-            if val:
-               if isinstance(val, list):
-                  jql.append(f"{key} not in ({','.join(val)})")
-               elif isinstance(val, str):
-                  jql.append(f"{key} != {val}")
-
-      for key, val in kwargs.items():
-         if val:
-            if isinstance(val, list):
-               list_val = [f"'{v}'" for v in val]
-               jql.append(f"{key} in ({','.join(list_val)})")
-            elif isinstance(val, str):
-               jql.append(f"{key} = '{val}'")
-
-      issues = self.tracker_client.search_issues(" AND ".join(jql))
-      for issue in issues:
-         normalized_issue = self.__normalize_issue(issue)
-         # Put the Epic in front of story (contains parent Epic) in the return list_issues
-         if normalized_issue.type == Ticket.Type.Epic:
-            list_issues.insert(0, normalized_issue)
-         else:
-            list_issues.append(normalized_issue)
-      return list_issues
+      # deque allows to prepend tickets in O(1)
+      list_issues = deque()
+      exclude_condition = kwargs.pop('exclude', None) or {}
+      # Clauses are sorted so that the same conditions always give the same JQL
+      jql = sorted([self.__jql_clause(key, val, negate=True) for key, val in exclude_condition.items()
+                    if val and isinstance(val, (list, str))] +
+                   [self.__jql_clause(key, val) for key, val in kwargs.items()
+                    if val and isinstance(val, (list, str))])
+
+      jql = " AND ".join([f'project={self.project}'] + jql)
+
+      def search_page(start_at):
+         # POST request is not limited by the URL length for long JQL
+         return self.tracker_client.search_issues(jql,
+                                                  startAt=start_at,
+                                                  maxResults=self.SEARCH_PAGE_SIZE,
+                                                  fields=self.SEARCH_FIELDS,
+                                                  use_post=True)
+
+      # The first page gives the total count and the page size which is really applied by the server,
+      # the remaining pages are then requested concurrently and consumed in their original order
+      first_page = search_page(0)
+      page_size = len(first_page)
+      next_starts = range(page_size, first_page.total, page_size) if page_size else ()
+      with ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as executor:
+         next_pages = executor.map(search_page, next_starts)
+         for issue in chain(first_page, chain.from_iterable(next_pages)):
+            normalized_issue = self.__normalize_issue(issue)
+            # Put the Epic in front of story (contains parent Epic) in the return list_issues
+            if normalized_issue.type == Ticket.Type.Epic:
+               list_issues.appendleft(normalized_issue)
+            else:
+               list_issues.append(normalized_issue)
+      return list(list_issues)
+
+   def get_tickets_by_ids(self, ids: list) -> dict:
+      """
+Get multiple tickets by their IDs with bulk JQL queries.
+
+**Arguments:**
+
+* ``ids``
+
+  / *Condition*: required / *Type*: list /
+
+  The IDs of the tickets, numeric issue IDs (from the title of synced tickets) or issue keys.
+
+**Returns:**
+
+* ``tickets``
+
+  / *Type*: dict /
+
+  A dictionary of the retrieved tickets with the given IDs as keys.
+      """
+      tickets = dict()
+      list_ids = list(dict.fromkeys(ids))
+      for i in range(0, len(list_ids), self.BULK_QUERY_SIZE):
+         chunk_ids = list_ids[i:i+self.BULK_QUERY_SIZE]
+         try:
+            # validate_query=False: not existing keys are reported as warning instead of error
+            issues = self.tracker_client.search_issues(f"key in ({','.join(str(id) for id in chunk_ids)})",
+                                                       maxResults=len(chunk_ids),
+                                                       fields=self.SEARCH_FIELDS,
+                                                       validate_query=False,
+                                                       use_post=True)
+         except self.get_request_errors() as reason:
+            log_warning(f"Bulk query of {self.TYPE} issues failed, they are requested one by one. Reason: {reason}")
+            tickets.update(super().get_tickets_by_ids(chunk_ids))
+            continue
+         # JQL resolves numeric values as issue IDs, so an issue is matched by its ID or its key
+         requested_ids = {str(id): id for id in chunk_ids}
+         for issue in issues:
+            requested_id = requested_ids.get(str(issue.id), requested_ids.get(issue.key))
+            if requested_id is not None:
+               tickets[requested_id] = self.__normalize_issue(issue)
+      return tickets
 
    def create_ticket(self, project: str = None, **kwargs) -> str:
       """
@@ -824,7 +1340,7 @@ Create a new ticket in the Jira tracker.
       issue = self.tracker_client.create_issue(project=project, **kwargs)
       return issue.key
 
-   def update_ticket(self, id: str, **kwargs):
+   def update_ticket(self, id: str, issue_client=None, **kwargs):
       """
 Update an existing ticket in the Jira tracker.
 
@@ -836,13 +1352,19 @@ Update an existing ticket in the Jira tracker.
 
   The ID of the ticket to update.
 
+* ``issue_client``
+
+  / *Condition*: optional / *Type*: <class 'jira.resources.Issue'> / *Default*: None /
+
+  The already retrieved issue object, it avoids to request the issue again.
+
 * ``kwargs``
 
   / *Condition*: required / *Type*: dict /
 
   Additional keyword arguments for updating the ticket.
       """
-      edit_issue = self.tracker_client.issue(id)
+      edit_issue = issue_client if issue_client is not None else self.tracker_client.issue(id)
       edit_issue.update(**kwargs)
 
    def get_priority(self, issue) -> int:
@@ -865,15 +1387,14 @@ Get the priority of an issue.
 
   The priority of the issue.
       """
-      if issue.fields.priority:
-         if int(issue.fields.priority.id) in range(1,6):
-            return int(issue.fields.priority.id)
+      priority = issue.raw['fields'].get('priority')
+      if priority:
+         if int(priority['id']) in range(1,6):
+            return int(priority['id'])
          else:
             # return priority level as int base on its name
-            for level, names in self.PRIORITY_LEVEL.items():
-               if issue.fields.priority.name in names:
-                  return int(level)
-         return 5 # return level 5 if priority is set but not match any definition level
+            # return level 5 if priority is set but not match any definition level
+            return self.PRIORITY_NAME_TO_LEVEL.get(priority['name'], 5)
 
       return None
 
@@ -904,10 +1425,12 @@ Get the story points of an issue.
   The story points of the issue.
       """
       # customfield_10224 from API response contains Estimate story point attribute
-      if 'customfield_10224' in issue.raw['fields'] and issue.raw['fields']['customfield_10224']:
-         return int(issue.raw['fields']['customfield_10224'])
+      fields = issue.raw['fields']
+      story_point = fields.get('customfield_10224')
+      if story_point:
+         return int(story_point)
       else:
-         return self.get_story_point_from_labels(issue.raw['fields']['labels'])
+         return self.get_story_point_from_labels(fields['labels'])
 
       # convert estimation time to story point
       # if 'timetracking' in issue.raw['fields'] and issue.raw['fields']['timetracking'] and 'remainingEstimateSeconds' in issue.raw['fields']['timetracking']:
@@ -1056,7 +1579,7 @@ Get Sprint information from given issue
       sprint_name = None
       if issue.raw.get('fields', {}).get('customfield_10821'):
          for sprint in issue.raw.get('fields', {}).get('customfield_10821'):
-            name = re.findall(r"name=([^,]*)", str(sprint))
+            name = JIRA_SPRINT_NAME_PATTERN.findall(str(sprint))
             if name:
                sprint_name = name[0]
       return sprint_name
@@ -1099,34 +1622,98 @@ Add issues to Sprint
       except Exception as reason:
          raise Exception(f"Failed to add issue {', '.join(str(id) for id in list_issues)} to Sprint '{sprint_name}'. Reason: {reason}")
 
-class GithubTracker(TrackerService):
-   """
-Tracker client to integrate with issues on GitHub.
-   """
-   TYPE = "github"
+class GithubTracker(TrackerService):
+   """
+Tracker client to integrate with issues on GitHub.
+   """
+   TYPE = "github"
+
+   # Maximum number of concurrent requests when normalizing issues
+   MAX_WORKERS = 8
+
+   # Number of items per page of GitHub REST API (maximum is 100, default is 30)
+   PER_PAGE = 100
+
+   # Ticket attributes which can be checked for exclusion on the raw issue data before normalization
+   EARLY_EXCLUDE_KEYS = frozenset(("id", "title", "assignee", "url", "status", "component", "labels"))
+
+   def __init__(self):
+      """
+Initialize the GithubTracker instance.
+      """
+      super().__init__()
+      self.repositories = list()
+      self.repository_clients = dict()
+      self.repository_labels = dict()
+      self.graphql_session = None
+      self.project = None
+      self.project_number = None
+      self.project_field_mapping = {}
+      self.project_field_value_mapping = {}
+      self._token = None
+      self._hostname = "api.github.com"
+
+   def __normalize_issue(self, issue, repo: str, ticket: Ticket = None) -> Ticket:
+      """
+Normalize an issue to a Ticket object.
+
+**Arguments:**
+
+* ``issue``
+
+  / *Condition*: required / *Type*: <class 'github.Issue.Issue'> /
+
+  The issue data.
+
+* ``repo``
+
+  / *Condition*: required / *Type*: str /
+
+  The repository name.
+
+* ``ticket``
+
+  / *Condition*: optional / *Type*: Ticket / *Default*: None /
+
+  The preview ticket of the issue which is completed, it is created if not given.
+
+**Returns:**
+
+* ``ticket``
 
-   def __init__(self):
-      """
-Initialize the GithubTracker instance.
-      """
-      super().__init__()
-      self.repositories = list()
-      self.project = None
-      self.project_number = None
-      self.project_field_mapping = {}
-      self.project_field_value_mapping = {}
-      self._token = None
-      self._hostname = "api.github.com"
+  / *Type*: Ticket /
 
-   def __normalize_issue(self, issue, repo: str) -> Ticket:
+  A Ticket object created from the issue data.
       """
-Normalize an issue to a Ticket object.
+      if ticket is None:
+         ticket = self.__preview_issue(issue, repo)
+      project_fields = self.__get_project_fields(issue)
+      if "priority" in project_fields and "story_point" in project_fields:
+         priority, story_point = project_fields["priority"], project_fields["story_point"]
+      else:
+         priority, story_point = self.get_planning_from_labels(ticket.labels)
+         priority = project_fields.get("priority", priority)
+         story_point = project_fields.get("story_point", story_point)
+      # The preview ticket is completed in place instead of creating another Ticket object
+      ticket.description = issue._rawData.get("body")
+      ticket.priority = priority
+      ticket.story_point = story_point
+      ticket.sprint = project_fields.get("sprint")
+      ticket.issue_client = issue
+      ticket.type = self.__get_issue_type(issue)
+      ticket.children = self.__get_sub_issues(issue)
+      ticket.parent = self.__get_parent_issue(issue)
+      return ticket
+
+   def __preview_issue(self, issue, repo: str) -> Ticket:
+      """
+Create a Ticket object with the attributes of the raw issue data only, without further requests.
 
 **Arguments:**
 
 * ``issue``
 
-  / *Condition*: required / *Type*: <class 'gitlab.v4.objects.issues.ProjectIssue'> /
+  / *Condition*: required / *Type*: <class 'github.Issue.Issue'> /
 
   The issue data.
 
@@ -1142,28 +1729,18 @@ Normalize an issue to a Ticket object.
 
   / *Type*: Ticket /
 
-  A Ticket object created from the issue data.
+  A Ticket object with the attributes of the raw issue data.
       """
-      project_fields = self.__get_project_fields(issue)
-      labels = [label.name for label in issue.labels]
-      story_point = project_fields.get("story_point") if "story_point" in project_fields else self.get_story_point_from_labels(labels)
-      priority = project_fields.get("priority") if "priority" in project_fields else self.get_priority_from_labels(labels)
+      # Read from raw data directly to avoid the attribute handling of PyGithub objects
+      raw_data = issue._rawData
       return Ticket(self.TYPE,
-                    issue.number,
-                    issue.title,
-                    issue.body,
-                    [assignee.login for assignee in issue.assignees],
-                    issue.html_url,
-                    Status.normalize_issue_status(self.TYPE, issue.state),
-                    repo,
-                    labels=labels,
-                    priority=priority,
-                    story_point=story_point,
-                    sprint=project_fields.get("sprint"),
-                    issue_client=issue,
-                    type=self.__get_issue_type(issue),
-                    children=self.__get_sub_issues(issue),
-                    parent=self.__get_parent_issue(issue))
+                    raw_data["number"],
+                    raw_data["title"],
+                    assignee=[assignee["login"] for assignee in raw_data.get("assignees") or []],
+                    url=raw_data["html_url"],
+                    status=Status.normalize_issue_status(self.TYPE, raw_data["state"]),
+                    component=repo,
+                    labels=[label["name"] for label in raw_data.get("labels") or []])
 
    def __get_repository_client(self, repository: str = None):
       """
@@ -1185,22 +1762,25 @@ Get the repository client for the specified repository.
 
   The repository client.
       """
-      if repository:
-         return self.tracker_client.get_repo(f"{self.project}/{repository}")
-      elif self.repositories:
-         if len(self.repositories) == 1:
-            return self.tracker_client.get_repo(f"{self.project}/{self.repositories[0]}")
-         else:
+      if not repository:
+         if not self.repositories:
+            raise Exception(f"Missing GitHub repository information")
+         elif len(self.repositories) > 1:
             raise Exception(f"More than one GitHub repository is configured, please specify the working repository")
-      else:
-         raise Exception(f"Missing GitHub repository information")
+         repository = self.repositories[0]
+
+      # Cache the repository client to avoid requesting the repository again
+      repository_client = self.repository_clients.get(repository)
+      if repository_client is None:
+         repository_client = self.tracker_client.get_repo(f"{self.project}/{repository}")
+         # setdefault is atomic, a client requested concurrently for the same repository is kept
+         repository_client = self.repository_clients.setdefault(repository, repository_client)
+      return repository_client
 
    def __get_issue_type(self, issue):
-      try:
-         if issue._rawData['sub_issues_summary']['total'] > 0:
-            return Ticket.Type.Epic
-      except:
-         pass
+      sub_issues_summary = issue._rawData.get('sub_issues_summary')
+      if sub_issues_summary and sub_issues_summary.get('total', 0) > 0:
+         return Ticket.Type.Epic
 
       return Ticket.Type.Story
 
@@ -1336,8 +1916,19 @@ Connect to the GitHub tracker.
       self.project_field_value_mapping = project_field_value_mapping if project_field_value_mapping else {}
       self._token = token
       self._hostname = hostname
+      self.repository_clients = dict()
+      self.repository_labels = dict()
+      # SDK of each tracker is imported only when the tracker is used
+      from github import Github, Auth
       auth = Auth.Token(token)
-      self.tracker_client = Github(auth=auth, base_url=f"https://{hostname}")
+      # Connection pool is sized for the concurrent requests when normalizing issues
+      self.tracker_client = Github(auth=auth,
+                                   base_url=f"https://{hostname}",
+                                   per_page=self.PER_PAGE,
+                                   pool_size=self.MAX_WORKERS)
+      # Keep-alive session for GraphQL requests of GitHub Projects v2,
+      # these requests are queries only so that all methods can be retried
+      self.graphql_session = create_http_session(pool_maxsize=self.MAX_WORKERS, retry_methods=None)
 
    def __get_graphql_endpoint(self) -> str:
       """
@@ -1399,7 +1990,7 @@ Execute a GraphQL request against the GitHub API.
       if variables:
          payload["variables"] = variables
 
-      response = requests.post(endpoint, json=payload, headers=headers, timeout=30)
+      response = self.graphql_session.post(endpoint, json=payload, headers=headers, timeout=30)
       response.raise_for_status()
       result = response.json()
       if "errors" in result:
@@ -1556,28 +2147,62 @@ Get tickets from the GitHub tracker.
 
   A list of tickets that satisfy the given conditions.
       """
-      list_issues = list()
-      exclude_condition = None
-      if 'exclude' in kwargs:
-         exclude_condition = kwargs['exclude']
-         del kwargs['exclude']
-      for repo in self.repositories:
-         con_repo = self.tracker_client.get_repo(f"{self.project}/{repo}")
-         if ("labels" in kwargs) and isinstance(kwargs["labels"], str):
-            kwargs["labels"] = [kwargs["labels"]]
-         issues = con_repo.get_issues(**kwargs)
-         for issue in issues:
-            if not issue.pull_request:
-               issue = self.__normalize_issue(issue, repo)
-               if self.exclude_ticket_by_condition(issue, exclude_condition):
-                  # Put the sub issues in front of parent issues (contains sub issue information)
-                  # in the return list_issues
-                  if issue.type == "Story":
-                     list_issues.insert(0, issue)
-                  else:
-                     list_issues.append(issue)
+      # deque allows to prepend tickets in O(1)
+      list_issues = deque()
+      exclude_condition = kwargs.pop('exclude', None) or {}
+      # Conditions on attributes of the raw issue data are checked before the normalization
+      # to avoid its requests for excluded issues, the other conditions are checked afterwards
+      is_not_excluded_early = self.compile_exclude_condition(
+         {key: val for key, val in exclude_condition.items() if key in self.EARLY_EXCLUDE_KEYS})
+      is_not_excluded = self.compile_exclude_condition(
+         {key: val for key, val in exclude_condition.items() if key not in self.EARLY_EXCLUDE_KEYS})
+      if ("labels" in kwargs) and isinstance(kwargs["labels"], str):
+         kwargs["labels"] = [kwargs["labels"]]
+      # GitHub issue has only 2 states, excluding one of them for all issues is requesting
+      # the other state, so that the excluded issues are not transferred at all
+      if kwargs.get("state") == "all" and exclude_condition.get("status") in (Status.open, Status.closed):
+         kwargs["state"] = "closed" if exclude_condition["status"] == Status.open else "open"
+
+      def get_repository_issues(repo):
+         con_repo = self.__get_repository_client(repo)
+         # Issues API also returns pull requests, they are identified by the raw 'pull_request' key
+         # The preview tickets which pass the early exclude conditions are completed by the normalization
+         previews = ((issue, repo, self.__preview_issue(issue, repo)) for issue in con_repo.get_issues(**kwargs)
+                     if "pull_request" not in issue._rawData)
+         return [item for item in previews if is_not_excluded_early(item[2])]
+
+      with ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as executor:
+         # Issues of all repositories are requested concurrently, the order of repositories is kept
+         issues = list(chain.from_iterable(executor.map(get_repository_issues, self.repositories)))
+         # Normalization requests sub issues, parent issue and project fields of each issue,
+         # these requests are sent concurrently for all issues
+         tickets = executor.map(lambda item: self.__normalize_issue(*item), issues)
+         for issue in tickets:
+            if is_not_excluded(issue):
+               # Put the sub issues in front of parent issues (contains sub issue information)
+               # in the return list_issues
+               if issue.type == "Story":
+                  list_issues.appendleft(issue)
+               else:
+                  list_issues.append(issue)
 
-      return list_issues
+      return list(list_issues)
+
+   def get_request_errors(self) -> tuple:
+      """
+Get the exception types which are raised by the Github client when a ticket
+is not found or a request to Github fails.
+
+**Returns:**
+
+* ``request_errors``
+
+  / *Type*: tuple /
+
+  The exception types of request errors.
+      """
+      from github import GithubException
+      return (GithubException, requests.exceptions.RequestException)
 
    def get_ticket(self, id: int, repository: str = None) -> Ticket:
       """
@@ -1644,7 +2269,7 @@ Create a new ticket in the GitHub tracker.
       issue = gh_repo.create_issue(**kwargs)
       return issue.number
 
-   def update_ticket(self, id: int, repository: str = None, **kwargs):
+   def update_ticket(self, id: int, repository: str = None, issue_client=None, **kwargs):
       """
 Update an existing ticket in the GitHub tracker.
 
@@ -1662,14 +2287,21 @@ Update an existing ticket in the GitHub tracker.
 
   The repository name.
 
+* ``issue_client``
+
+  / *Condition*: optional / *Type*: <class 'github.Issue.Issue'> / *Default*: None /
+
+  The already retrieved issue object, it avoids to request the issue again.
+
 * ``kwargs``
 
   / *Condition*: required / *Type*: dict /
 
   Additional keyword arguments for updating the ticket.
       """
-      gh_repo = self.__get_repository_client(repository)
-      edit_issue = gh_repo.get_issue(id)
+      edit_issue = issue_client
+      if edit_issue is None:
+         edit_issue = self.__get_repository_client(repository).get_issue(id)
       edit_issue.edit(**kwargs)
 
    def create_label(self, label_name: str, color: str = None, repository: str = None):
@@ -1697,18 +2329,25 @@ Create a new label in the GitHub tracker.
   The repository name.
       """
       gh_repo = self.__get_repository_client(repository)
-      list_existing_labels = gh_repo.get_labels()
-      for item in list_existing_labels:
-         if item.name == label_name:
+      # Check and creation of label are done under lock, so that a label is not created
+      # twice when issues are synced concurrently
+      with self.cache_lock:
+         # Existing labels are requested once per repository
+         existing_labels = self.repository_labels.get(repository)
+         if existing_labels is None:
+            existing_labels = {item.name for item in gh_repo.get_labels()}
+            self.repository_labels[repository] = existing_labels
+         if label_name in existing_labels:
             return
 
-      label_pros = {
-         'name': label_name,
-         'color': color if color else self.SPRINT_LABEL_COLOR
-      }
+         label_pros = {
+            'name': label_name,
+            'color': color if color else self.SPRINT_LABEL_COLOR
+         }
 
-      label_pros['color'] = label_pros['color'].replace('#', '')
-      gh_repo.create_label(**label_pros)
+         label_pros['color'] = label_pros['color'].replace('#', '')
+         gh_repo.create_label(**label_pros)
+         existing_labels.add(label_name)
 
 class GitlabTracker(TrackerService):
    """
@@ -1719,12 +2358,23 @@ other method requires `project` information to interact properly with inside iss
    """
    TYPE = "gitlab"
 
+   # Maximum number of concurrent requests
+   MAX_WORKERS = 8
+
+   # Multiple issues are requested with a single (paginated) issues query
+   SUPPORT_BULK_QUERY = True
+
+   # Number of items per page of Gitlab REST API (maximum is 100, default is 20)
+   PER_PAGE = 100
+
    def __init__(self):
       """
 Initialize the GitlabTracker instance.
       """
       super().__init__()
       self.project = list()
+      self.project_clients = dict()
+      self.project_labels = dict()
       self.group = None
 
    def __normalize_issue(self, issue, project):
@@ -1753,18 +2403,20 @@ Normalize an issue to a Ticket object.
 
   A Ticket object created from the issue data.
       """
+      labels = issue.labels
+      priority, story_point = self.get_planning_from_labels(labels)
       return Ticket(
          self.TYPE,
-         self.__get_issue_id(issue),
-         self.__get_issue_title(issue),
-         self.__get_issue_description(issue),
-         self.__get_issue_assignee(issue),
-         self.__get_issue_url(issue),
-         self.__get_issue_status(issue),
+         issue.iid,
+         issue.title,
+         issue.description,
+         issue.assignee['username'] if issue.assignee else None,
+         issue.web_url,
+         Status.normalize_issue_status(self.TYPE, issue.state),
          project,
-         labels=self.__get_issue_labels(issue),
-         priority=self.get_priority_from_labels(issue.labels),
-         story_point=self.get_story_point(issue),
+         labels=labels,
+         priority=priority,
+         story_point=story_point,
          issue_client=issue,
          type="Story",
          children=self.__get_sub_issues(issue),
@@ -1773,8 +2425,7 @@ Normalize an issue to a Ticket object.
 
    def get_user_id(self, username: str):
       try:
-         user = self.tracker_client.users.list(username=username)[0]
-         return user.id
+         return get_gitlab_user_id(self.tracker_client, username)
       except:
          raise Exception(f"Could not found given user name '{username}' on gitlab.")
 
@@ -1792,163 +2443,6 @@ Normalize an issue to a Ticket object.
       # There is Epic but it is for Premium and was deprecated in GitLab 17.0
       return None
 
-   def __get_issue_id(self, issue):
-      """
-Get the identifier of an issue.
-
-**Arguments:**
-
-* ``issue``
-
-  / *Condition*: required / *Type*: dict /
-
-  The issue data.
-
-**Returns:**
-
-* ``identifier``
-
-  / *Type*: str /
-
-  The identifier of the issue.
-      """
-      return issue.iid
-
-   def __get_issue_title(self, issue):
-      """
-Get the title of an issue.
-
-**Arguments:**
-
-* ``issue``
-
-  / *Condition*: required / *Type*: dict /
-
-  The issue data.
-
-**Returns:**
-
-* ``title``
-
-  / *Type*: str /
-
-  The title of the issue.
-      """
-      return issue.title
-
-   def __get_issue_description(self, issue):
-      """
-Get the description of an issue.
-
-**Arguments:**
-
-* ``issue``
-
-  / *Condition*: required / *Type*: dict /
-
-  The issue data.
-
-**Returns:**
-
-* ``description``
-
-  / *Type*: str /
-
-  The description of the issue.
-      """
-      return issue.description
-
-   def __get_issue_assignee(self, issue):
-      """
-Get the assignee of an issue.
-
-**Arguments:**
-
-* ``issue``
-
-  / *Condition*: required / *Type*: dict /
-
-  The issue data.
-
-**Returns:**
-
-* ``assignee``
-
-  / *Type*: str /
-
-  The assignee of the issue.
-      """
-      if issue.assignee:
-         return issue.assignee['username']
-
-      return None
-
-   def __get_issue_url(self, issue):
-      """
-Get the URL of an issue.
-
-**Arguments:**
-
-* ``issue``
-
-  / *Condition*: required / *Type*: dict /
-
-  The issue data.
-
-**Returns:**
-
-* ``url``
-
-  / *Type*: str /
-
-  The URL of the issue.
-      """
-      return issue.web_url
-
-   def __get_issue_status(self, issue):
-      """
-Get the status of an issue.
-
-**Arguments:**
-
-* ``issue``
-
-  / *Condition*: required / *Type*: dict /
-
-  The issue data.
-
-**Returns:**
-
-* ``status``
-
-  / *Type*: str /
-
-  The status of the issue.
-      """
-      return Status.normalize_issue_status(self.TYPE, issue.state)
-
-   def __get_issue_labels(self, issue):
-      """
-Get the labels of an issue.
-
-**Arguments:**
-
-* ``issue``
-
-  / *Condition*: required / *Type*: dict /
-
-  The issue data.
-
-**Returns:**
-
-* ``labels``
-
-  / *Type*: list /
-
-  The labels of the issue.
-      """
-      return issue.labels
-
    def __get_project_client(self, project=None):
       """
 Get the project client for the specified project.
@@ -1969,17 +2463,23 @@ Get the project client for the specified project.
 
   The project client.
       """
-      if project:
-         return self.tracker_client.projects.get(f"{self.group}/{project}")
-      elif self.project:
-         if len(self.project) == 1:
-            return self.tracker_client.projects.get(f"{self.group}/{self.project[0]}")
-         else:
+      if not project:
+         if not self.project:
+            raise Exception(f"Missing Gitlab project information")
+         elif len(self.project) > 1:
             raise Exception(f"More than one Gitlab project is configured, please specify the working project")
-      else:
-         raise Exception(f"Missing Gitlab project information")
+         project = self.project[0]
 
-   def connect(self, group: str, project: Union[list, str], token: str, hostname: str = "https://gitlab.com"):
+      # Cache the project client to avoid requesting the project again
+      project_client = self.project_clients.get(project)
+      if project_client is None:
+         project_client = self.tracker_client.projects.get(f"{self.group}/{project}")
+         # setdefault is atomic, a client requested concurrently for the same project is kept
+         project_client = self.project_clients.setdefault(project, project_client)
+      return project_client
+
+   def connect(self, group: str, project: Union[list, str], token: str, hostname: str = "https://gitlab.com",
+               http_cache: str = None):
       """
 Connect to the Gitlab tracker.
 
@@ -2008,17 +2508,46 @@ Connect to the Gitlab tracker.
   / *Condition*: optional / *Type*: str / *Default*: "https://gitlab.com" /
 
   The hostname of the Gitlab server.
+
+* ``http_cache``
+
+  / *Condition*: optional / *Type*: str / *Default*: None /
+
+  Directory to cache the HTTP responses of the Gitlab server between runs.
       """
-      self.group = group
-      self.project = project
-      if isinstance(project, list):
-         self.project = project
-      elif isinstance(project, str):
+      if isinstance(project, str):
          self.project = [project]
+      elif isinstance(project, list):
+         self.project = project
       else:
          raise Exception("'project' parameter should be list of projects or string of single project")
+      self.group = group
+
+      self.project_clients = dict()
+      self.project_labels = dict()
+      # SDK of each tracker is imported only when the tracker is used
+      from gitlab import Gitlab
+      self.tracker_client = Gitlab(hostname, private_token=token,
+                                   session=create_http_session(pool_maxsize=self.MAX_WORKERS,
+                                                               cache_dir=http_cache))
+      # Username to ID cache of the client, it is used by the tracker and by the tickets of its issues
+      self.tracker_client.user_ids = dict()
+
+   def get_request_errors(self) -> tuple:
+      """
+Get the exception types which are raised by the Gitlab client when a ticket
+is not found or a request to Gitlab fails.
+
+**Returns:**
+
+* ``request_errors``
 
-      self.tracker_client = Gitlab(hostname, private_token=token)
+  / *Type*: tuple /
+
+  The exception types of request errors.
+      """
+      from gitlab.exceptions import GitlabError
+      return (GitlabError, requests.exceptions.RequestException)
 
    def get_ticket(self, id: int, project: str = None) -> Ticket:
       """
@@ -2071,27 +2600,70 @@ Get tickets from the Gitlab tracker.
   A list of tickets that satisfy the given conditions.
       """
       list_issues = list()
-      exclude_condition = None
-      if 'exclude' in kwargs:
-         exclude_condition = kwargs['exclude']
-         del kwargs['exclude']
+      is_not_excluded = self.compile_exclude_condition(kwargs.pop('exclude', None))
 
       # 'assignee' is transformed to 'assignee_username' for client argument
       if 'assignee' in kwargs:
-         assignee_val  = kwargs['assignee']
-         kwargs['assignee_username'] = assignee_val
-         del kwargs['assignee']
+         kwargs['assignee_username'] = kwargs.pop('assignee')
 
-      for project in self.project:
+      normalize_issue = self.__normalize_issue
+      list_kwargs = {"per_page": self.PER_PAGE, **kwargs}
+
+      def get_project_tickets(project):
          gl_project = self.__get_project_client(project)
-         issues = gl_project.issues.list(**kwargs)
-         for issue in issues:
-            issue = self.__normalize_issue(issue, project)
-            if self.exclude_ticket_by_condition(issue, exclude_condition):
-               list_issues.append(issue)
+         # Iterate lazily over all pages instead of getting only the first page
+         issues = gl_project.issues.list(iterator=True, **list_kwargs)
+         return [ticket for ticket in (normalize_issue(issue, project) for issue in issues)
+                 if is_not_excluded(ticket)]
+
+      # Issues of the projects are requested concurrently, the order of projects is kept
+      with ThreadPoolExecutor(max_workers=max(min(self.MAX_WORKERS, len(self.project)), 1)) as executor:
+         for project_tickets in executor.map(get_project_tickets, self.project):
+            list_issues.extend(project_tickets)
 
       return list_issues
 
+   def get_tickets_by_ids(self, ids: list, project: str = None) -> dict:
+      """
+Get multiple tickets by their IDs with a single (paginated) issues query.
+
+**Arguments:**
+
+* ``ids``
+
+  / *Condition*: required / *Type*: list /
+
+  The IDs (iid) of the tickets.
+
+* ``project``
+
+  / *Condition*: optional / *Type*: str / *Default*: None /
+
+  The project name.
+
+**Returns:**
+
+* ``tickets``
+
+  / *Type*: dict /
+
+  A dictionary of the retrieved tickets with the given IDs as keys.
+      """
+      if not ids:
+         return dict()
+      try:
+         gl_project = self.__get_project_client(project)
+         issues = gl_project.issues.list(iids=list(dict.fromkeys(ids)), get_all=True, per_page=self.PER_PAGE)
+      except self.get_request_errors() as reason:
+         log_warning(f"Bulk query of {self.TYPE} issues failed, they are requested one by one. Reason: {reason}")
+         return super().get_tickets_by_ids(ids)
+      issue_ids = {str(id): id for id in ids}
+      tickets = dict()
+      for issue in issues:
+         if str(issue.iid) in issue_ids:
+            tickets[issue_ids[str(issue.iid)]] = self.__normalize_issue(issue, gl_project.name)
+      return tickets
+
    def create_ticket(self, project: str = None, **kwargs) -> str:
       """
 Create a new ticket in the Gitlab tracker.
@@ -2127,7 +2699,7 @@ Create a new ticket in the Gitlab tracker.
       issue = gl_project.issues.create(**kwargs)
       return issue.iid
 
-   def update_ticket(self, id: int, project: str = None , **kwargs):
+   def update_ticket(self, id: int, project: str = None, issue_client=None, **kwargs):
       """
 Update an existing ticket in the Gitlab tracker.
 
@@ -2145,19 +2717,27 @@ Update an existing ticket in the Gitlab tracker.
 
   The project name.
 
+* ``issue_client``
+
+  / *Condition*: optional / *Type*: <class 'gitlab.v4.objects.issues.ProjectIssue'> / *Default*: None /
+
+  The already retrieved issue object, it avoids to request the issue again.
+
 * ``kwargs``
 
   / *Condition*: required / *Type*: dict /
 
   Additional keyword arguments for updating the ticket.
       """
-      gl_project = self.__get_project_client(project)
-      edit_issue = gl_project.issues.get(id)
+      if issue_client is None:
+         # Update the issue with a single PUT request instead of getting it before
+         self.__get_project_client(project).issues.update(id, kwargs)
+         return
 
       for attr, val in kwargs.items():
-         setattr(edit_issue, attr, val)
+         setattr(issue_client, attr, val)
 
-      edit_issue.save()
+      issue_client.save()
 
    def get_story_point(self, issue):
       """
@@ -2215,17 +2795,24 @@ Create a new label in the Gitlab tracker.
   The project name.
       """
       gl_project = self.__get_project_client(repository)
-      list_existing_labels = gl_project.labels.list(get_all=True)
-      for item in list_existing_labels:
-         if item.name == label_name:
+      # Check and creation of label are done under lock, so that a label is not created
+      # twice when issues are synced concurrently
+      with self.cache_lock:
+         # Existing labels are requested once per project
+         existing_labels = self.project_labels.get(repository)
+         if existing_labels is None:
+            existing_labels = {item.name for item in gl_project.labels.list(get_all=True, per_page=self.PER_PAGE)}
+            self.project_labels[repository] = existing_labels
+         if label_name in existing_labels:
             return
 
-      label_pros = {
-         'name': label_name,
-         'color': color if color else self.SPRINT_LABEL_COLOR
-      }
+         label_pros = {
+            'name': label_name,
+            'color': color if color else self.SPRINT_LABEL_COLOR
+         }
 
-      gl_project.labels.create(label_pros)
+         gl_project.labels.create(label_pros)
+         existing_labels.add(label_name)
 
 class RTCTracker(TrackerService):
    """
@@ -2240,14 +2827,15 @@ Initialize the RTCTracker instance.
       super().__init__()
       self.project = None
       self.hostname = None
+      self.url_titles = dict()
 
-      self.returned_prop = ["dc:title",
+      self.returned_prop = ("dc:title",
                             "dc:identifier",
                             "rtc_cm:state",
                             "rtc_cm:ownedBy",
                             "dc:description",
                             "rtc_cm:teamArea",
-                            "rtc_cm:com.ibm.team.workitem.attribute.storyPointsNumeric"]
+                            "rtc_cm:com.ibm.team.workitem.attribute.storyPointsNumeric")
 
    def __normalize_issue(self, issue):
       """
@@ -2285,6 +2873,16 @@ Normalize a RTC issues to Ticket object.
                      parent=self.__get_parent_issue(issue)
                      )
 
+   def __get_title_from_url(self, url):
+      # Many work items share the same priority and planned for resources,
+      # so the title of each resource is requested only once
+      title = self.url_titles.get(url)
+      if title is None:
+         title = self.tracker_client.get_info_from_url(url, 'dcterms:title')
+         # setdefault is atomic, the title requested first by concurrent sync jobs is kept
+         title = self.url_titles.setdefault(url, title)
+      return title
+
    def __get_workitem_status(self, issue):
       if issue['dcterms:type'] == "Story":
          return Status.normalize_issue_status(self.TYPE, issue['oslc_cm:status'])
@@ -2301,30 +2899,21 @@ Normalize a RTC issues to Ticket object.
       children_id = []
       children_nodes = issue['rtc_cm:com.ibm.team.workitem.linktype.parentworkitem.children']
       for node in children_nodes:
-         try:
-            workitem_id = node['rdf:resource'].split("/")[-1]
-            children_id.append(workitem_id)
-         except:
-            pass
+         if 'rdf:resource' in node:
+            children_id.append(node['rdf:resource'].rpartition("/")[2])
       return children_id
 
    def __get_parent_issue(self, issue):
-      parent_id = None
-      parent_nodes = issue['rtc_cm:com.ibm.team.workitem.linktype.parentworkitem.parent']
-      try:
-         parent_id = parent_nodes[0]['rdf:resource'].split("/")[-1]
-      except:
-         pass
-      return parent_id
+      parent_nodes = issue.get('rtc_cm:com.ibm.team.workitem.linktype.parentworkitem.parent')
+      if parent_nodes and parent_nodes[0].get('rdf:resource'):
+         return parent_nodes[0]['rdf:resource'].rpartition("/")[2]
+      return None
 
    def __get_user_id(self, issue):
-      user_id = None
-      try:
-         user_url = issue['dcterms:contributor']['rdf:resource']
-         user_id =  user_url.split("/")[-1].lower()
-      except:
-         pass
-      return user_id
+      contributor = issue.get('dcterms:contributor')
+      if contributor and contributor.get('rdf:resource'):
+         return contributor['rdf:resource'].rpartition("/")[2].lower()
+      return None
 
    def connect(self, project: str, hostname: str, username: str = None,
                token: str = None, file_against: str = None,
@@ -2397,9 +2986,12 @@ Connect to the RTC tracker.
       """
       self.project = project
       self.hostname = hostname
+      # SDK of each tracker is imported only when the tracker is used
+      from IssueSyncTool.rtc_client import RTCClient
       self.tracker_client = RTCClient(hostname, project, username, token,
                                       file_against, workflow_id, state_transition,
                                       project_scope, planned_for)
+      self.url_titles = dict()
 
    def get_ticket(self, id: Union[str, int]) -> Ticket:
       """
@@ -2468,9 +3060,9 @@ Get the priority attribute of an issue.
       """
       if 'oslc_cmx:priority' in issue and 'rdf:resource' in issue['oslc_cmx:priority']:
          try:
-            priority = self.tracker_client.get_info_from_url(issue['oslc_cmx:priority']['rdf:resource'], 'dcterms:title')
+            priority = self.__get_title_from_url(issue['oslc_cmx:priority']['rdf:resource'])
             # Try to get priority as integer value
-            matched_priority = re.match(r"^(\d)(\s*-\s8\w+)?", priority)
+            matched_priority = RTC_PRIORITY_PATTERN.match(priority)
             if matched_priority:
                priority = int(matched_priority.group(1))
             else:
@@ -2501,10 +3093,13 @@ Get the planned for attribute of an issue.
   The planned for attribute of the issue.
       """
       if 'rtc_cm:plannedFor' in issue and 'rdf:resource' in issue['rtc_cm:plannedFor']:
+         url = issue['rtc_cm:plannedFor']['rdf:resource']
          try:
-            plannedFor = self.tracker_client.get_info_from_url(issue['rtc_cm:plannedFor']['rdf:resource'], 'dcterms:title')
+            plannedFor = self.__get_title_from_url(url)
             return plannedFor
          except:
+            # Remember the failure so that the other work items of the same iteration do not request it again
+            self.url_titles.setdefault(url, "")
             return ""
       return ""
 
@@ -2559,7 +3154,7 @@ Create a new ticket in the RTC tracker.
          kwargs['planned_for'] = kwargs.pop('sprint')
       return self.tracker_client.create_workitem(**kwargs)
 
-   def update_ticket(self, ticket_id: str, **kwargs):
+   def update_ticket(self, ticket_id: str, issue_client=None, **kwargs):
       """
 Update an existing ticket in the RTC tracker.
 
@@ -2571,6 +3166,12 @@ Update an existing ticket in the RTC tracker.
 
   The ID of the ticket to update.
 
+* ``issue_client``
+
+  / *Condition*: optional / *Type*: object / *Default*: None /
+
+  Not used, RTC work items are always updated by their ID.
+
 * ``kwargs``
 
   / *Condition*: required / *Type*: dict /
@@ -2627,13 +3228,10 @@ Create a tracker instance of the specified type.
 
   If the specified tracker type is not supported.
       """
-      trackers = Tracker.get_support_trackers()
-
-      if type in trackers.keys():
-         tracker = trackers[type](*args, **kwargs)
-         return tracker
-      else:
+      tracker_class = Tracker.get_support_trackers().get(type)
+      if tracker_class is None:
          raise NotImplementedError(f"not supported tracker '{type}'")
+      return tracker_class(*args, **kwargs)
 
    @staticmethod
    def get_support_trackers() -> dict:
@@ -2648,4 +3246,4 @@ Get a dictionary of supported tracker types and their corresponding classes.
 
   A dictionary where the keys are tracker types and the values are the corresponding tracker classes.
       """
-      return {cls.TYPE: cls for cls in TrackerService.__subclasses__()}
+      return TrackerService.TRACKERS
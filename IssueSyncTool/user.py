@@ -1,9 +1,12 @@
-from typing import Any, Union
+import sys
+from typing import Union
 
 class User:
    """
 Class representing a user with a name and an ID.
    """
+   __slots__ = ("name", "id")
+
    def __init__(self, name: str, id: Union[str, dict] = None):
       """
 Initialize a new User.
@@ -43,6 +46,8 @@ class UserManagement:
    """
 Class for managing a list of users.
    """
+   __slots__ = ("users", "user_index")
+
    def __init__(self, users: list):
       """
 Initialize the UserManagement instance.
@@ -55,12 +60,18 @@ Initialize the UserManagement instance.
 
   A list of user data dictionaries.
       """
-      self.users = []
-      for item in users:
-         name = item['name']
-         del item['name']
-         user = User(name, item)
-         self.users.append(user)
+      # The given user data is not modified, the name is only left out of the user IDs
+      # Users are kept in configured order as tuple, they are not changed after the initialization
+      self.users = tuple(User(item['name'], {key: val for key, val in item.items() if key != 'name'})
+                         for item in users)
+      # Index of users by tracker and lower case ID for constant time lookup
+      self.user_index = dict()
+      for user in self.users:
+         for tracker, user_id in user.id.items():
+            if isinstance(user_id, str):
+               # the first configured user wins as with the former linear search
+               # tracker names are interned like the TYPE constants of the trackers used for lookup
+               self.user_index.setdefault(sys.intern(tracker), dict()).setdefault(user_id.lower(), user)
 
    def get_user(self, id: str, tracker: str) -> Union[User, None]:
       """
@@ -88,18 +99,70 @@ Get a user by their ID and tracker.
 
   The user object if found, otherwise None.
       """
-      for user in self.users:
-         if isinstance(user.id, dict) and (tracker in user.id) and (user.id[tracker].lower() == id.lower()):
-            return user
+      return self.user_index.get(tracker, {}).get(id.lower())
+
+   def __contains__(self, key: tuple) -> bool:
+      """
+Check whether a user with the given tracker and ID exists.
+
+**Arguments:**
+
+* ``key``
+
+  / *Condition*: required / *Type*: tuple /
+
+  The tracker type and the ID of the user, e.g. ``("github", "ngoan1608")``.
+
+**Returns:**
+
+* ``is_existing``
+
+  / *Type*: bool /
+
+  True if the user exists, otherwise False.
+      """
+      tracker, id = key
+      return id.lower() in self.user_index.get(tracker, {})
+
+   def __getitem__(self, key: tuple) -> User:
+      """
+Get a user by the given tracker and ID.
+
+**Arguments:**
+
+* ``key``
+
+  / *Condition*: required / *Type*: tuple /
+
+  The tracker type and the ID of the user, e.g. ``("github", "ngoan1608")``.
+
+**Returns:**
+
+* ``user``
+
+  / *Type*: User /
+
+  The user object.
 
-      return None
+**Raises:**
 
-if __name__ == "__main__":
-   user = User("Ngoan")
-   user.id = "ntd1hc"
-   user.id = {
-      "github": "ngoan1608",
-      "rtc": "ntd1hc"
-   }
+* ``KeyError``
 
-   print(user)
\ No newline at end of file
+  If the user does not exist.
+      """
+      tracker, id = key
+      return self.user_index[tracker][id.lower()]
+
+   def __iter__(self):
+      """
+Iterate over the users in configured order.
+
+**Returns:**
+
+* ``users``
+
+  / *Type*: Iterator[User] /
+
+  The iterator over the users.
+      """
+      return iter(self.users)
@@ -1,3 +1,5 @@
+import re
+
 CONFIG_SCHEMA = {
    "type": "object",
    "properties": {
@@ -63,6 +65,7 @@ CONFIG_SCHEMA = {
                   "hostname": {"type": "string"},
                   "token": {"type": "string"},
                   "group": {"type": "string"},
+                  "http_cache": {"type": "string"},
                   "project" : {
                      "minItems": 1,
                      "$ref": "#/$defs/array_of_string"
@@ -266,4 +269,7 @@ REGEX_PRIORITY_LABEL = r"prio\s*(\d+)"
 
 REGEX_STORY_POINT_LABEL = r"(\d+)\s*pts"
 
+# Title of RTC priority, e.g. "1 - Very High", shared by RTC client and tracker
+RTC_PRIORITY_PATTERN = re.compile(r"^(\d)(\s*-\s*\w+)?")
+
 REGEX_SPRINT_BACKLOG = r"[Bb]acklog.*"
\ No newline at end of file
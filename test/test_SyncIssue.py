@@ -0,0 +1,133 @@
+import sys
+import os
+import threading
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../"))
+from IssueSyncTool import sync_issue
+from IssueSyncTool.tracker import Tracker, TrackerService, Ticket, Status
+
+class StubIssueClient():
+   def __init__(self, ticket):
+      self.ticket = ticket
+
+   def edit(self, **kwargs):
+      # the synced title is visible to the children which are synced later
+      if 'title' in kwargs:
+         self.ticket.title = kwargs['title']
+
+class StubSourceTracker(TrackerService):
+   def __init__(self):
+      super().__init__()
+      # TYPE is set on the instance so that the stub is not registered as tracker
+      self.TYPE = "github"
+      self.tickets = dict()
+      for id, title, type, parent in (("1", "Epic one", Ticket.Type.Epic, None),
+                                      ("2", "[ 200 ] Epic two", Ticket.Type.Epic, None),
+                                      ("3", "Story of Epic one", Ticket.Type.Story, {"id": "1"}),
+                                      ("4", "Story of Epic two", Ticket.Type.Story, {"id": "2"}),
+                                      ("5", "[ 300 ] Story five", Ticket.Type.Story, {"id": "2"}),
+                                      ("6", "[ 301 ] Story six", Ticket.Type.Story, None),
+                                      ("7", "[ 302 ] Story seven", Ticket.Type.Story, None),
+                                      ("8", "[ 404 ] Story not found", Ticket.Type.Story, None)):
+         ticket = Ticket(self.TYPE, id, title, url=f"https://github.com/stub/{id}",
+                         status=Status.open, type=type, parent=parent)
+         ticket.issue_client = StubIssueClient(ticket)
+         self.tickets[id] = ticket
+
+   def connect(self, **kwargs):
+      pass
+
+   def get_ticket(self, id, repository=None):
+      return self.tickets[id]
+
+   def get_tickets(self, **kwargs):
+      return list(self.tickets.values())
+
+   def create_ticket(self, **kwargs):
+      raise NotImplementedError()
+
+   def create_label(self, label_name, color=None, repository=None):
+      pass
+
+class StubDestinationTracker(TrackerService):
+   SUPPORT_BULK_QUERY = True
+
+   def __init__(self):
+      super().__init__()
+      self.TYPE = "rtc"
+      self.bulk_queries = list()
+      self.history = list()
+      self.lock = threading.Lock()
+
+   def connect(self, **kwargs):
+      pass
+
+   def __ticket(self, id):
+      return Ticket(self.TYPE, id, f"Destination {id}", assignee="unassigned",
+                    status=Status.open, sprint="Sprint 1", priority=2)
+
+   def get_ticket(self, id):
+      if id == "404":
+         raise Exception("not found")
+      return self.__ticket(id)
+
+   def get_tickets(self, **kwargs):
+      return list()
+
+   def get_tickets_by_ids(self, ids):
+      self.bulk_queries.append(list(ids))
+      return {id: None if id == "404" else self.__ticket(id) for id in ids}
+
+   def create_ticket(self, **kwargs):
+      # ID depends only on the ticket so that the result does not depend on the job scheduling
+      res_id = str(900 + len(kwargs['title']))
+      with self.lock:
+         self.history.append((kwargs['type'], "create", res_id, kwargs['parent']))
+      return res_id
+
+   def update_ticket(self, ticket_id, issue_client=None, **kwargs):
+      with self.lock:
+         self.history.append((None, "update", ticket_id, None))
+
+   def update_ticket_state(self, ticket, status):
+      pass
+
+def run_sync(monkeypatch, capsys, tmp_path, jobs):
+   source = StubSourceTracker()
+   destination = StubDestinationTracker()
+   trackers = {"github": source, "rtc": destination}
+   config = {
+      "source": ["github"],
+      "destination": ["rtc"],
+      "user": [],
+      "tracker": {"github": {}, "rtc": {}}
+   }
+   monkeypatch.chdir(tmp_path)
+   monkeypatch.setattr(sys, "argv", ["IssueSyncTool", "--config", "config.json", "--csv", "--jobs", str(jobs)])
+   monkeypatch.setattr(sync_issue, "process_configuration", lambda path_file: config)
+   monkeypatch.setattr(Tracker, "create", staticmethod(lambda type: trackers[type]))
+   capsys.readouterr()
+   sync_issue.SyncIssue()
+   summary = [line for line in capsys.readouterr().out.splitlines() if "has been synced" in line]
+   with open(tmp_path / "sync_status.csv", encoding="utf-8") as csv_file:
+      rows = csv_file.read().splitlines()
+   return summary, rows, source, destination
+
+def test_concurrent_sync_gives_same_result(monkeypatch, capsys, tmp_path):
+   summary, rows, _, _ = run_sync(monkeypatch, capsys, tmp_path, jobs=1)
+   assert len(rows) == 9
+   assert rows[-1] == "8,Github 8,https://github.com/stub/8,rtc 404,not found"
+   assert "7 issues has been synced to rtc successfully! 1 issues are not synced due to error." in summary[-1]
+   for _ in range(5):
+      assert run_sync(monkeypatch, capsys, tmp_path, jobs=8)[:2] == (summary, rows)
+
+def test_concurrent_sync_keeps_epic_before_story(monkeypatch, capsys, tmp_path):
+   _, _, source, destination = run_sync(monkeypatch, capsys, tmp_path, jobs=8)
+   # destination issues are prefetched per issue type
+   assert destination.bulk_queries == [["200"], ["300", "301", "302", "404"]]
+   # Epics are created before their Stories, which get the destination ID of the Epic as parent
+   created = [entry for entry in destination.history if entry[1] == "create"]
+   assert [entry[0] for entry in created] == [Ticket.Type.Epic, Ticket.Type.Story, Ticket.Type.Story]
+   epic_id = created[0][2]
+   assert sorted(entry[3] for entry in created[1:]) == sorted([epic_id, "200"])
+   assert source.tickets["1"].title == f"[ {epic_id} ] Epic one"
@@ -1,3 +1,12 @@
+import sys
+import os
+import threading
+import time
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../"))
+from IssueSyncTool.tracker import JiraTracker, GithubTracker, Ticket, TrackerService
+
 class test_GitlabTracker():
    def test_connection():
       pass
@@ -60,4 +69,112 @@ class test_JIRATracker():
       pass
 
    def test_update_ticket():
-      pass
\ No newline at end of file
+      pass
+
+
+def jira_issue(id, key):
+   return SimpleNamespace(id=id, key=key, raw={
+      "fields": {
+         "summary": f"Issue {key}",
+         "status": {"name": "Open"},
+         "labels": [],
+         "issuetype": {"name": "Story"}
+      }
+   })
+
+def test_jira_get_tickets_by_ids():
+   list_jql = list()
+   def search_issues(jql, **kwargs):
+      list_jql.append(jql)
+      return [jira_issue("10001", "PROJ-1"), jira_issue("10002", "PROJ-2"), jira_issue("10003", "PROJ-3")]
+
+   tracker = JiraTracker()
+   tracker.hostname = "https://jira.example.com"
+   tracker.tracker_client = SimpleNamespace(search_issues=search_issues)
+   tickets = tracker.get_tickets_by_ids(["10001", "10002", "PROJ-3", "10001"])
+   assert list_jql == ["key in (10001,10002,PROJ-3)"]
+   assert list(tickets) == ["10001", "10002", "PROJ-3"]
+   assert [ticket.id for ticket in tickets.values()] == ["PROJ-1", "PROJ-2", "PROJ-3"]
+
+def test_exclude_condition_without_conditions():
+   for exclude_condition in (None, {}):
+      is_not_excluded = TrackerService.compile_exclude_condition(exclude_condition)
+      assert is_not_excluded(Ticket("github", "1", "Title"))
+
+def test_exclude_condition_labels():
+   bug = Ticket("github", "1", "Title", labels=["bug", "prio 1"])
+   feature = Ticket("github", "2", "Title", labels=["feature"])
+   unlabeled = Ticket("github", "3", "Title")
+
+   is_not_excluded = TrackerService.compile_exclude_condition({"labels": "bug"})
+   assert [is_not_excluded(ticket) for ticket in (bug, feature, unlabeled)] == [False, True, True]
+
+   is_not_excluded = TrackerService.compile_exclude_condition({"labels": ["bug", "feature"]})
+   assert [is_not_excluded(ticket) for ticket in (bug, feature, unlabeled)] == [False, False, True]
+
+   is_not_excluded = TrackerService.compile_exclude_condition({"labels": "empty"})
+   assert [is_not_excluded(ticket) for ticket in (bug, feature, unlabeled)] == [True, True, False]
+
+   is_not_excluded = TrackerService.compile_exclude_condition({"labels": ["empty", "feature"]})
+   assert [is_not_excluded(ticket) for ticket in (bug, feature, unlabeled)] == [True, False, False]
+
+def test_exclude_condition_assignee():
+   single = Ticket("jira", "1", "Title", assignee="ntd1hc")
+   multiple = Ticket("github", "2", "Title", assignee=["ngoan1608", "octocat"])
+   unassigned = Ticket("github", "3", "Title")
+
+   # string assignee is matched by substring, list assignee by its items
+   is_not_excluded = TrackerService.compile_exclude_condition({"assignee": "d1h"})
+   assert [is_not_excluded(ticket) for ticket in (single, multiple, unassigned)] == [False, True, True]
+
+   is_not_excluded = TrackerService.compile_exclude_condition({"assignee": ["octocat", "ntd1hc"]})
+   assert [is_not_excluded(ticket) for ticket in (single, multiple, unassigned)] == [False, False, True]
+
+   is_not_excluded = TrackerService.compile_exclude_condition({"assignee": "empty"})
+   assert [is_not_excluded(ticket) for ticket in (single, multiple, unassigned)] == [True, True, False]
+
+def test_exclude_condition_other_attribute():
+   is_not_excluded = TrackerService.compile_exclude_condition({"status": "closed", "labels": "bug"})
+   assert not is_not_excluded(Ticket("github", "1", "Title", status="closed"))
+   assert not is_not_excluded(Ticket("github", "2", "Title", labels=["bug"]))
+   assert is_not_excluded(Ticket("github", "3", "Title", status="open", labels=["feature"]))
+
+class SearchResult(list):
+   total = 0
+
+def test_jira_jql_values_are_escaped():
+   list_jql = list()
+   def search_issues(jql, **kwargs):
+      list_jql.append(jql)
+      return SearchResult()
+
+   tracker = JiraTracker()
+   tracker.project = "PROJ"
+   tracker.tracker_client = SimpleNamespace(search_issues=search_issues)
+   tracker.get_tickets(labels=["it's", "a\\b"], assignee="o'neil", exclude={"component": "x' OR '1'='1"})
+   assert list_jql == ["project=PROJ AND assignee = 'o\\'neil' AND component != 'x\\' OR \\'1\\'=\\'1' "
+                       "AND labels in ('it\\'s','a\\\\b')"]
+
+def test_github_concurrent_create_label():
+   created_labels = list()
+   def get_labels():
+      time.sleep(0.01)
+      return [SimpleNamespace(name="bug")]
+   def create_label(name, color):
+      time.sleep(0.01)
+      created_labels.append((name, color))
+
+   tracker = GithubTracker()
+   tracker.repositories = ["repo"]
+   tracker.repository_clients["repo"] = SimpleNamespace(get_labels=get_labels, create_label=create_label)
+   barrier = threading.Barrier(8)
+   def create_labels():
+      barrier.wait()
+      tracker.create_labels(["Sprint 1", "bug", "Sprint 1"], repository="repo")
+
+   list_threads = [threading.Thread(target=create_labels) for _ in range(8)]
+   for thread in list_threads:
+      thread.start()
+   for thread in list_threads:
+      thread.join()
+   assert created_labels == [("Sprint 1", "007bff")]
@@ -1,2 +1,26 @@
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../"))
+from IssueSyncTool.utils import CONFIG_SCHEMA
+from IssueSyncTool.sync_issue import inline_schema_refs, is_valid_config
+
 class test_Configuration():
-   pass
\ No newline at end of file
+   pass
+
+def test_inline_schema_refs_keeps_sibling_keywords():
+   schema = inline_schema_refs(CONFIG_SCHEMA)
+   assert "$defs" not in schema
+   assert schema["properties"]["destination"]["minItems"] == 1
+   assert schema["properties"]["destination"]["type"] == "array"
+
+def test_empty_destination_is_invalid():
+   config = {
+      "source": ["github"],
+      "destination": [],
+      "user": [],
+      "tracker": {}
+   }
+   assert not is_valid_config(config)
+   config["destination"] = ["rtc"]
+   assert is_valid_config(config)